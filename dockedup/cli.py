@@ -2,30 +2,37 @@
 DockedUp CLI - Interactive Docker Compose stack monitor.
 """
 
+import functools
 import time
+import signal
 import subprocess
 import threading
-import os
 import logging
-from typing import Dict, List, Optional
+from datetime import datetime
+from types import FrameType
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Tuple
 from typing_extensions import Annotated
 import typer
-from rich.console import Console, Group
-from rich.live import Live
+from rich.console import Console, ConsoleDimensions, Group, JustifyMethod
 from rich.table import Table
 from rich.panel import Panel
-from rich.layout import Layout
 from rich.align import Align
 from rich.text import Text
 from rich.logging import RichHandler
-import docker
-from docker.errors import DockerException
-import readchar
+from rich.markup import escape
 
-from .docker_monitor import ContainerMonitor
-from .utils import format_uptime
+from .utils import NO_PROJECT, StatsSample, format_stats_sample, format_uptime
 from . import __version__, __description__
 
+# docker, the monitor, the live display, key handling and the panel build pool are
+# imported where they are used so that --version and --help start without loading them
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+    import docker
+    from rich.layout import Layout
+    from rich.live import Live
+
 # Configure logging
 logging.basicConfig(
     level=logging.WARNING,
@@ -48,132 +55,345 @@ app = typer.Typer(
 
 console = Console()
 
+# Shortest time between two redraws; requests arriving faster are merged
+MIN_FRAME_INTERVAL = 1 / 60
+# How long action results stay in the footer
+NOTIFICATION_SECONDS = 3.0
+# Panels are built on a small pool once more than this many need rebuilding in a frame
+PARALLEL_BUILD_THRESHOLD = 2
+PANEL_BUILD_WORKERS = 4
+
+# Static UI pieces, built once instead of on every frame
+_HEADER_TEXT = Text(
+    " DockedUp - Interactive Docker Compose Monitor", justify="center", style="bold magenta"
+)
+_HEADER_TEXT_DEBUG = _HEADER_TEXT.copy()
+_HEADER_TEXT_DEBUG.append(" [DEBUG MODE]", style="bold red")
+_HEADER = Align.center(_HEADER_TEXT)
+_HEADER_DEBUG = Align.center(_HEADER_TEXT_DEBUG)
+
+_FOOTER_NAV = "[b]Q[/b]uit | [b]↑/↓[/b] Navigate | [b]PgUp/PgDn[/b] Scroll Projects"
+_FOOTER_ACTIONS = " | [b]L[/b]ogs | [b]R[/b]estart | [b]S[/b]hell | [b]X[/b] Stop"
+_FOOTER_HELP = " | [b]?[/b] Help"
+# Parsed to Text up front so the markup is not re-parsed each time the footer is drawn
+_FOOTER_NO_SEL = Align.center(Text.from_markup(_FOOTER_NAV + _FOOTER_HELP))
+_FOOTER_WITH_SEL = Align.center(Text.from_markup(_FOOTER_NAV + _FOOTER_ACTIONS + _FOOTER_HELP))
+
+# Set while an interactive docker command owns the terminal, see main()'s SIGINT handler
+_foreground_child = threading.Event()
+
+# Keys that act on the selected container
+CONTAINER_ACTION_KEYS = ("l", "r", "x", "s")
+
+# Project table columns: (header, style, justify, no_wrap)
+_COLUMNS: Tuple[Tuple[str, Optional[str], JustifyMethod, bool], ...] = (
+    ("Container", "cyan", "left", True),
+    ("Status", None, "left", False),
+    ("Uptime", None, "right", False),
+    ("Health", None, "left", False),
+    ("CPU %", None, "right", False),
+    ("MEM USAGE / LIMIT", None, "right", False),
+)
+
+
+class ContainerSnapshot(NamedTuple):
+    """Immutable view of the container data, published to readers as a single reference."""
+
+    containers: Tuple[Dict, ...]
+    project_names: Tuple[str, ...]
+    project_to_container_indices: Dict[str, Tuple[int, ...]]
+    container_index_to_project_index: Tuple[int, ...]
+    # Per project, the fields each table row is built from:
+    # (id, name, status, health, started_at or None when not running)
+    project_rows: Dict[str, Tuple[Tuple, ...]]
+
+
+EMPTY_SNAPSHOT = ContainerSnapshot((), (), {}, (), {})
+
+
+def _project_rows(grouped_containers: Dict[str, List[Dict]]) -> Dict[str, Tuple[Tuple, ...]]:
+    """Extract the per-row table fields once per data change rather than every frame."""
+    return {
+        proj_name: tuple(
+            (
+                container["id"],
+                container["name"],
+                container["status"],
+                container["health"],
+                container["started_at"] if container["is_running"] else None,
+            )
+            for container in containers_in_project
+        )
+        for proj_name, containers_in_project in grouped_containers.items()
+    }
+
 
 class AppState:
-    """Manages the application's shared interactive state with thread-safety."""
+    """
+    Manages the application's shared interactive state.
+
+    Container data lives in an immutable ContainerSnapshot that is replaced
+    wholesale on update. Readers grab ``state.snapshot`` once and index into it
+    without locking; the lock only serializes snapshot updates.
+    """
 
     def __init__(self):
         # Data structures
-        self.all_containers: List[Dict] = []
-        self.project_names: List[str] = []
-        self.project_to_container_indices: Dict[str, List[int]] = {}
-        self.container_index_to_project_index: Dict[int, int] = {}
+        self.snapshot: ContainerSnapshot = EMPTY_SNAPSHOT
+        self._grouped_source: Optional[Dict[str, List[Dict]]] = None
+        # (project names, container ids) the current index structures were built for
+        self._layout_key: Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]] = None
+        # Latest raw stats sample per container id, shared with the monitor's stats threads
+        self.stats: Dict[str, StatsSample] = {}
+        # Root layout reused across frames, created by the first generate_ui call
+        self.layout: Optional["Layout"] = None
+        # Rendered project panels keyed by the rows they were built from
+        self.panel_cache: Dict[str, Tuple[Tuple, Panel]] = {}
 
         # UI State
         self.selected_index: int = 0
         self.scroll_offset: int = 0  # Index of the project at the top of the viewport
-        self.viewport_height_projects: int = 1  # How many projects fit on screen
+        self.viewport_lines: int = 8  # Lines available to project panels, set per frame
+        # Terminal size, refreshed on SIGWINCH rather than queried every frame
+        self.term_size: ConsoleDimensions = console.size
 
         # Control
         self.lock = threading.Lock()
-        self.ui_updated_event = threading.Event()
         self.debug_mode: bool = False
 
+        # Transient footer message: (markup, monotonic expiry time)
+        self.notification: Optional[Tuple[str, float]] = None
+
+        # Render pump: a monotonically increasing count of redraw requests
+        self.render_requests: int = 0
+        self._render_cv = threading.Condition()
+        # Inputs of the frame currently on screen, see render_key()
+        self.last_render_key: Optional[Tuple] = None
+        # Worker pool for building many project panels at once, created on first use
+        self._build_pool: Optional["ThreadPoolExecutor"] = None
+
     def update_containers(self, grouped_containers: Dict[str, List[Dict]]):
-        """Rebuilds all data structures from the latest container data."""
+        """
+        Builds a new snapshot from the latest container data and publishes it.
+
+        Expects the grouping as returned by ContainerMonitor.get_grouped_containers,
+        i.e. already sorted by project and container name. Passing the same
+        grouping object again is a no-op.
+        """
         with self.lock:
-            current_id = self._get_selected_container_id_unsafe()
-
-            # Rebuild all data structures
-            self.project_names = sorted(grouped_containers.keys())
-            self.all_containers = []
-            self.project_to_container_indices = {}
-            self.container_index_to_project_index = {}
-
-            flat_index = 0
-            for proj_index, proj_name in enumerate(self.project_names):
-                # Sort containers within each project for consistent order
-                containers_in_project = sorted(
-                    grouped_containers[proj_name], key=lambda c: c.get("name", "")
+            if grouped_containers is self._grouped_source:
+                return
+            self._grouped_source = grouped_containers
+
+            project_names = tuple(grouped_containers.keys())
+            containers: List[Dict] = []
+            for containers_in_project in grouped_containers.values():
+                containers.extend(containers_in_project)
+            layout_key = (project_names, tuple(container["id"] for container in containers))
+
+            # Most updates change a container's state but not which containers
+            # exist or where they sit, so the index structures can be kept
+            if layout_key == self._layout_key:
+                self.snapshot = self.snapshot._replace(
+                    containers=tuple(containers), project_rows=_project_rows(grouped_containers)
                 )
-                self.project_to_container_indices[proj_name] = []
-                for container in containers_in_project:
-                    self.all_containers.append(container)
-                    self.project_to_container_indices[proj_name].append(flat_index)
-                    self.container_index_to_project_index[flat_index] = proj_index
-                    flat_index += 1
+                return
+            self._layout_key = layout_key
 
-            container_id_to_index = {c.get("id"): i for i, c in enumerate(self.all_containers)}
+            previous = self.get_selected_container()
 
-            # Restore selection if possible, otherwise reset
-            if current_id and current_id in container_id_to_index:
-                self.selected_index = container_id_to_index[current_id]
-            elif self.all_containers:
-                self.selected_index = 0
-            else:
-                self.selected_index = 0
+            # Build the new index structures locally
+            project_to_container_indices: Dict[str, Tuple[int, ...]] = {}
+            container_index_to_project_index: List[int] = []
 
-            # Ensure selection and scroll are within new bounds
-            self.selected_index = max(0, min(self.selected_index, len(self.all_containers) - 1))
-            self.scroll_offset = max(0, min(self.scroll_offset, len(self.project_names) - 1))
+            first_index = 0
+            for proj_index, proj_name in enumerate(project_names):
+                count = len(grouped_containers[proj_name])
+                project_to_container_indices[proj_name] = tuple(
+                    range(first_index, first_index + count)
+                )
+                container_index_to_project_index.extend([proj_index] * count)
+                first_index += count
 
-    def get_selected_container(self) -> Optional[Dict]:
-        """Get the currently selected container."""
-        with self.lock:
-            if self.all_containers and 0 <= self.selected_index < len(self.all_containers):
-                return self.all_containers[self.selected_index]
-        return None
+            # Drop cached panels of projects that no longer exist
+            for proj_name in list(self.panel_cache):
+                if proj_name not in grouped_containers:
+                    del self.panel_cache[proj_name]
 
-    def _get_selected_container_id_unsafe(self) -> Optional[str]:
-        """Get selected container ID without acquiring lock (internal use)."""
-        if self.all_containers and 0 <= self.selected_index < len(self.all_containers):
-            return self.all_containers[self.selected_index].get("id")
-        return None
+            # Restore selection if possible, otherwise reset
+            selected_index = self._locate_container(
+                previous, containers, project_to_container_indices
+            )
 
-    def move_selection(self, delta: int):
-        """Move selection up/down, automatically scrolling the viewport if needed."""
-        with self.lock:
-            if not self.all_containers:
-                return
+            # Publish the snapshot, then bring selection and scroll within its bounds
+            self.snapshot = ContainerSnapshot(
+                tuple(containers),
+                project_names,
+                project_to_container_indices,
+                tuple(container_index_to_project_index),
+                _project_rows(grouped_containers),
+            )
+            self.selected_index = max(0, min(selected_index, len(containers) - 1))
+            self.scroll_offset = max(0, min(self.scroll_offset, len(project_names) - 1))
+
+    def _locate_container(
+        self,
+        container: Optional[Dict],
+        containers: List[Dict],
+        project_to_container_indices: Dict[str, Tuple[int, ...]],
+    ) -> int:
+        """
+        Find a container's index in freshly built data, or 0 if it is gone.
+
+        Most updates change a container's state rather than the set of
+        containers, so the current index is tried first. Otherwise only the
+        container's own project is scanned, instead of indexing every id.
+        """
+        if container is None:
+            return 0
+        container_id = container.get("id")
+
+        index = self.selected_index
+        if index < len(containers) and containers[index].get("id") == container_id:
+            return index
+
+        project_name = container.get("project", NO_PROJECT)
+        for index in project_to_container_indices.get(project_name, ()):
+            if containers[index].get("id") == container_id:
+                return index
+        return 0
+
+    def request_render(self) -> None:
+        """Ask the render loop for a redraw. Safe to call from any thread."""
+        with self._render_cv:
+            self.render_requests += 1
+            self._render_cv.notify()
+
+    def wait_for_render(self, last_seen: int, timeout: Optional[float] = None) -> int:
+        """
+        Block until a redraw is requested after ``last_seen`` or the timeout expires.
+
+        Requests are counted rather than flagged, so one made while the caller
+        was busy rendering is never lost.
+
+        Returns:
+            The request count observed on wake-up, to pass back in as ``last_seen``
+        """
+        with self._render_cv:
+            self._render_cv.wait_for(lambda: self.render_requests != last_seen, timeout=timeout)
+            return self.render_requests
+
+    def build_pool(self) -> "ThreadPoolExecutor":
+        """Get the panel build pool, starting it on first use."""
+        if self._build_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._build_pool = ThreadPoolExecutor(
+                max_workers=PANEL_BUILD_WORKERS, thread_name_prefix="panel-build"
+            )
+        return self._build_pool
+
+    def shutdown(self) -> None:
+        """Release the panel build pool."""
+        if self._build_pool is not None:
+            self._build_pool.shutdown(wait=False)
+            self._build_pool = None
+
+    def render_key(self, stats_version: int) -> Tuple:
+        """
+        Collect everything generate_ui's output depends on.
+
+        If the key equals the one of the frame on screen, the frame can be kept
+        as-is. Uptimes change once per second, so the wall-clock second is part
+        of the key.
+        """
+        return (
+            self.snapshot,
+            self.selected_index,
+            self.scroll_offset,
+            self.term_size,
+            self.debug_mode,
+            stats_version,
+            int(time.time()),
+            self.get_notification(),
+        )
 
-            # calculate and clamp new selection index
-            new_index = self.selected_index + delta
-            self.selected_index = max(0, min(new_index, len(self.all_containers) - 1))
+    def notify(self, message: str, duration: float = NOTIFICATION_SECONDS) -> None:
+        """Show a message in the footer for ``duration`` seconds."""
+        self.notification = (message, time.monotonic() + duration)
+        self.request_render()
 
-            # Find the project corresponding to the new selection
-            newly_selected_project_index = self.container_index_to_project_index.get(
-                self.selected_index
-            )
-            if newly_selected_project_index is None:
-                return  # Should not happen
+    def get_notification(self) -> Optional[str]:
+        """Get the current footer message, if it has not expired yet."""
+        notification = self.notification
+        if notification is None or time.monotonic() >= notification[1]:
+            return None
+        return notification[0]
 
-            # Check if the project is outside the current viewport and adjust scroll
-            is_above = newly_selected_project_index < self.scroll_offset
-            is_below = newly_selected_project_index >= (
-                self.scroll_offset + self.viewport_height_projects
-            )
+    def get_selected_container(self) -> Optional[Dict]:
+        """Get the currently selected container."""
+        snapshot = self.snapshot
+        index = self.selected_index
+        if 0 <= index < len(snapshot.containers):
+            return snapshot.containers[index]
+        return None
 
-            if is_above:
-                # If selection moved above the viewport, scroll up to make it the top project
-                self.scroll_offset = newly_selected_project_index
-            elif is_below:
-                # If selection moved below, scroll down to make it the last visible project
-                self.scroll_offset = (
-                    newly_selected_project_index - self.viewport_height_projects + 1
-                )
+    def move_selection(self, delta: int):
+        """
+        Move selection up/down, automatically scrolling the viewport if needed.
+
+        Runs without the lock: the new values are computed against one snapshot
+        and stored with plain assignments. If a snapshot swap races with it,
+        update_containers re-clamps the selection on the next update.
+        """
+        snapshot = self.snapshot
+        if not snapshot.containers:
+            return
+
+        # calculate and clamp new selection index
+        selected_index = max(0, min(self.selected_index + delta, len(snapshot.containers) - 1))
+
+        # Find the project corresponding to the new selection
+        newly_selected_project_index = snapshot.container_index_to_project_index[selected_index]
+
+        # Check if the project is outside the current viewport and adjust scroll
+        scroll_offset = self.scroll_offset
+        if newly_selected_project_index < scroll_offset:
+            # If selection moved above the viewport, scroll up to make it the top project
+            scroll_offset = newly_selected_project_index
+        else:
+            # Otherwise scroll down until the project is inside the viewport. How many
+            # projects fit depends on where the window starts, so each candidate
+            # start is fitted the same way generate_ui will draw it
+            while (
+                _fit_projects(snapshot, scroll_offset, self.viewport_lines)
+                <= newly_selected_project_index
+            ):
+                scroll_offset += 1
 
-            # Ensure scroll offset is always valid
-            self.scroll_offset = max(0, min(self.scroll_offset, len(self.project_names) - 1))
+        self.selected_index = selected_index
+        # Ensure scroll offset is always valid
+        self.scroll_offset = max(0, min(scroll_offset, len(snapshot.project_names) - 1))
 
-        self.ui_updated_event.set()
+        self.request_render()
 
     def scroll_project_view(self, delta: int):
         """Scroll the project view and select the first container of the new top project."""
-        with self.lock:
-            if not self.project_names:
-                return
+        snapshot = self.snapshot
+        if not snapshot.project_names:
+            return
 
-            # Calculate and clamp new scroll offset
-            new_offset = self.scroll_offset + delta
-            self.scroll_offset = max(0, min(new_offset, len(self.project_names) - 1))
+        # Calculate and clamp new scroll offset
+        scroll_offset = max(0, min(self.scroll_offset + delta, len(snapshot.project_names) - 1))
 
-            # Update selection to the first container of the new top project
-            scrolled_to_project_name = self.project_names[self.scroll_offset]
-            container_indices = self.project_to_container_indices.get(scrolled_to_project_name, [])
-            if container_indices:
-                self.selected_index = container_indices[0]
+        # Update selection to the first container of the new top project
+        scrolled_to_project_name = snapshot.project_names[scroll_offset]
+        container_indices = snapshot.project_to_container_indices[scrolled_to_project_name]
+        self.scroll_offset = scroll_offset
+        if container_indices:
+            self.selected_index = container_indices[0]
 
-        self.ui_updated_event.set()
+        self.request_render()
 
 
 def setup_logging(debug: bool = False):
@@ -192,9 +412,101 @@ def version_callback(value: bool):
         raise typer.Exit()
 
 
-def run_docker_command(
-    live_display: Live, command: List[str], container_name: str, confirm: bool = False
-):
+def confirm_action(
+    action: str, container_name: str, read_key: Optional[Callable[[], Optional[str]]] = None
+) -> Optional[bool]:
+    """
+    Ask the user to confirm an action on a container. Expects the live display stopped.
+
+    Args:
+        action: Action name shown in the prompt
+        container_name: Container name shown in the prompt
+        read_key: Key source to read the answer from, normally the app's KeyReader;
+            defaults to ``readchar.readkey()``
+
+    Returns:
+        Whether the user confirmed, or None if the key source was closed (DockedUp
+        is shutting down) before an answer arrived
+    """
+    console.print(
+        f"\n[bold yellow]Are you sure you want to {action.capitalize()} container '{container_name}'? (y/n)[/bold yellow]"
+    )
+    if read_key is None:
+        import readchar
+
+        read_key = readchar.readkey
+
+    key = read_key()
+    if key is None:
+        return None
+    if key.lower() != "y":
+        console.print("[green]Aborted.[/green]")
+        time.sleep(1)
+        return False
+    return True
+
+
+def run_container_action(
+    live_display: "Live",
+    state: AppState,
+    client: "docker.DockerClient",
+    action: str,
+    container: Dict,
+    read_key: Optional[Callable[[], Optional[str]]] = None,
+) -> None:
+    """
+    Confirm, then restart or stop a container without leaving the live display.
+
+    Only the confirmation prompt needs the terminal. The action itself goes
+    straight to the Docker API through the existing client, and its outcome is
+    reported as a footer notification instead of a separate screen.
+
+    Args:
+        live_display: The running Live display
+        state: Application state used to show the notification
+        client: Connected Docker client
+        action: Either "restart" or "stop"
+        container: The selected container dictionary
+        read_key: Key source for the confirmation, see confirm_action
+    """
+    from docker.errors import DockerException
+    from requests.exceptions import RequestException
+
+    container_name = container["name"]
+    live_display.stop()
+    console.clear(home=True)
+    try:
+        confirmed = confirm_action(action, container_name, read_key)
+    except BaseException:
+        live_display.start(refresh=True)
+        raise
+    if confirmed is None:
+        # The key reader was closed on shutdown and main() has already left the
+        # live display, so restarting it would take the terminal back over
+        return
+    live_display.start(refresh=True)
+    if not confirmed:
+        return
+
+    state.notify(f"[yellow]⏳ Running '{action}' on '{escape(container_name)}'...[/yellow]")
+    try:
+        target = client.containers.get(container["id"])
+        if action == "restart":
+            target.restart()
+        else:
+            target.stop()
+        state.notify(
+            f"[green]✅ Command '{action}' executed successfully on '{escape(container_name)}'.[/green]"
+        )
+    # Timeouts and lost connections surface as plain requests errors, not DockerException
+    except (DockerException, RequestException) as e:
+        logger.debug(f"Failed to {action} container: {e}")
+        state.notify(
+            f"[bold red]Failed to {action} '{escape(container_name)}':[/bold red] {escape(str(e))}"
+        )
+
+
+def run_docker_command(live_display: "Live", command: List[str], container_name: str):
     """Pauses the live display to run a Docker command."""
     live_display.stop()
     console.clear(home=True)
@@ -203,24 +515,17 @@ def run_docker_command(
             command[1] == "logs" and "-f" in command
         )
 
-        if confirm:
-            action = command[1].capitalize()
-            console.print(
-                f"\n[bold yellow]Are you sure you want to {action} container '{container_name}'? (y/n)[/bold yellow]"
-            )
-            key = readchar.readkey().lower()
-            if key != "y":
-                console.print("[green]Aborted.[/green]")
-                time.sleep(1)
-                return
-
         if is_streaming_interactive:
-            command_str = " ".join(command)
-            if "logs -f" in command_str:
+            if command[1] == "logs":
                 console.print(
                     f"[bold cyan]Showing live logs for '{container_name}'. Press Ctrl+C to return.[/bold cyan]"
                 )
-            os.system(command_str)
+            # Run docker directly on the inherited terminal; Ctrl+C goes to it alone
+            _foreground_child.set()
+            try:
+                subprocess.run(command, check=False)
+            finally:
+                _foreground_child.clear()
         else:
             result = subprocess.run(command, capture_output=True, text=True, check=False)
             if result.returncode != 0:
@@ -248,96 +553,190 @@ def run_docker_command(
         live_display.start(refresh=True)
 
 
-def generate_ui(state: AppState) -> Layout:
-    """Generate the main UI layout based on the current AppState."""
-    layout = Layout(name="root")
-    layout.split(
-        Layout(name="header", size=3), Layout(ratio=1, name="main"), Layout(size=1, name="footer")
+# Lines a project panel takes besides its rows: panel borders, table title,
+# column header block and the table's bottom border
+PROJECT_PANEL_CHROME = 7
+
+
+def _fit_projects(snapshot: ContainerSnapshot, start_idx: int, available_height: int) -> int:
+    """Return the end index of the projects, starting at start_idx, that fit on screen."""
+    end_idx = start_idx
+    used_height = 0
+    for proj_name in snapshot.project_names[start_idx:]:
+        height = len(snapshot.project_to_container_indices[proj_name]) + PROJECT_PANEL_CHROME
+        if end_idx > start_idx and used_height + height > available_height:
+            break
+        used_height += height
+        end_idx += 1
+    return end_idx
+
+
+@functools.lru_cache(maxsize=128)
+def _scroll_info(
+    start_idx: int,
+    end_idx: int,
+    total: int,
+    debug_mode: bool = False,
+    selected_index: int = 0,
+    scroll_offset: int = 0,
+) -> str:
+    """Build the main panel title; cached since the scroll state rarely changes."""
+    scroll_info = ""
+    if start_idx > 0 or end_idx < total:
+        scroll_info = f"Showing projects {start_idx + 1}-{end_idx} of {total}"
+    if debug_mode:
+        scroll_info += f" | Selected Index: {selected_index} | Scroll Offset: {scroll_offset}"
+    return scroll_info
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_uptime(started_at: Optional[datetime], now_sec: int) -> str:
+    """Format an uptime once per container start time and wall-clock second."""
+    return format_uptime(started_at, now_sec)
+
+
+def _make_project_table(proj_name: str) -> Table:
+    """Create an empty project table with the standard column schema."""
+    table = Table(
+        title=f"Project: [bold cyan]{proj_name}[/bold cyan]",
+        border_style="blue",
+        expand=True,
+        show_lines=False,
     )
+    for header, style, justify, no_wrap in _COLUMNS:
+        table.add_column(header, style=style, justify=justify, no_wrap=no_wrap)
+    return table
 
-    header_text = Text(
-        " DockedUp - Interactive Docker Compose Monitor", justify="center", style="bold magenta"
-    )
-    if state.debug_mode:
-        header_text.append(" [DEBUG MODE]", style="bold red")
-    layout["header"].update(Align.center(header_text))
-
-    with state.lock:
-        if not state.all_containers:
-            layout["main"].update(
-                Align.center(Text("No containers found.", style="yellow"), vertical="middle")
+
+def _build_project_panel(
+    proj_name: str, rows: List[Tuple[str, ...]], selected_row: Optional[int]
+) -> Panel:
+    """Build the table panel for a single project."""
+    table = _make_project_table(proj_name)
+    for row in rows:
+        table.add_row(*row)
+    if selected_row is not None:
+        table.rows[selected_row].style = "on blue"
+    return Panel(table, border_style="dim blue")
+
+
+def generate_ui(state: AppState) -> "Layout":
+    """Generate the main UI layout based on the current AppState."""
+    layout = state.layout
+    if layout is None:
+        from rich.layout import Layout
+
+        # The region tree never changes, so it is built once and only its contents are swapped
+        layout = state.layout = Layout(name="root")
+        layout.split(
+            Layout(name="header", size=3),
+            Layout(ratio=1, name="main"),
+            Layout(size=1, name="footer"),
+        )
+    layout["header"].update(_HEADER_DEBUG if state.debug_mode else _HEADER)
+
+    # Read the shared state once so the whole frame is drawn from one consistent
+    # view, even if the input thread moves the selection meanwhile
+    snapshot = state.snapshot
+    selected_index = state.selected_index
+    scroll_offset = state.scroll_offset
+    has_selection = 0 <= selected_index < len(snapshot.containers)
+
+    if not snapshot.containers:
+        layout["main"].update(
+            Align.center(Text("No containers found.", style="yellow"), vertical="middle")
+        )
+    else:
+        # Viewport Calculation
+        chrome_height = 3 + 1 + 2  # header + footer + panel padding
+        available_height = max(8, state.term_size.height - chrome_height)
+
+        # Determine which projects are visible based on scroll offset, using each
+        # project's row count so that no off-screen panel is ever built
+        start_idx = max(0, min(scroll_offset, len(snapshot.project_names) - 1))
+        end_idx = _fit_projects(snapshot, start_idx, available_height)
+        state.viewport_lines = available_height
+        visible_project_names = snapshot.project_names[start_idx:end_idx]
+
+        # Locate the selected row once instead of comparing indices on every row
+        selected_project = None
+        selected_row_in_project = None
+        if has_selection:
+            selected_project = snapshot.project_names[
+                snapshot.container_index_to_project_index[selected_index]
+            ]
+            selected_row_in_project = (
+                selected_index - snapshot.project_to_container_indices[selected_project][0]
             )
-        else:
-            # Viewport Calculation
-            chrome_height = 3 + 1 + 2  # header + footer + panel padding
-            available_height = max(8, console.height - chrome_height)
-            # Estimate height per project (title + header + avg containers)
-            avg_project_height = 7
-            projects_per_screen = max(1, available_height // avg_project_height)
-            state.viewport_height_projects = projects_per_screen
-
-            # Determine which projects are visible based on scroll offset
-            start_idx = state.scroll_offset
-            end_idx = min(start_idx + projects_per_screen, len(state.project_names))
-            visible_project_names = state.project_names[start_idx:end_idx]
-
-            # Render Visible Projects
-            visible_renderables = []
-            for proj_name in visible_project_names:
-                table = Table(
-                    title=f"Project: [bold cyan]{proj_name}[/bold cyan]",
-                    border_style="blue",
-                    expand=True,
-                    show_lines=False,
-                )
-                table.add_column("Container", style="cyan", no_wrap=True)
-                table.add_column("Status", justify="left")
-                table.add_column("Uptime", justify="right")
-                table.add_column("Health", justify="left")
-                table.add_column("CPU %", justify="right")
-                table.add_column("MEM USAGE / LIMIT", justify="right")
-
-                container_indices = state.project_to_container_indices[proj_name]
-                for container_index in container_indices:
-                    container = state.all_containers[container_index]
-                    style = "on blue" if container_index == state.selected_index else ""
-                    uptime = (
-                        format_uptime(container.get("started_at"))
-                        if "Up" in container["status"]
-                        else "[grey50]—[/grey50]"
-                    )
-                    table.add_row(
-                        container["name"],
-                        container["status"],
-                        uptime,
-                        container["health"],
-                        container["cpu"],
-                        container["memory"],
-                        style=style,
-                    )
-                visible_renderables.append(Panel(table, border_style="dim blue"))
 
-            # Scroll Indicator
-            scroll_info = ""
-            if len(state.project_names) > projects_per_screen:
-                scroll_info = (
-                    f"Showing projects {start_idx + 1}-{end_idx} of {len(state.project_names)}"
+        # Render Visible Projects, reusing panels whose rows have not changed
+        now_sec = int(time.time())
+        stats = state.stats
+        visible_renderables: List[Optional[Panel]] = []
+        dirty: List[Tuple[int, str, List[Tuple[str, ...]], Optional[int], Tuple]] = []
+        for proj_name in visible_project_names:
+            selected_row = selected_row_in_project if proj_name == selected_project else None
+            project_rows = snapshot.project_rows[proj_name]
+            rows: List[Tuple[str, ...]] = [
+                (
+                    name,
+                    status,
+                    _cached_uptime(started_at, now_sec),
+                    health,
+                    *format_stats_sample(stats.get(container_id)),
                 )
+                for container_id, name, status, health, started_at in project_rows
+            ]
 
-            if state.debug_mode:
-                debug_info = f" | Selected Index: {state.selected_index} | Scroll Offset: {state.scroll_offset}"
-                scroll_info += debug_info
-
-            layout["main"].update(
-                Panel(Group(*visible_renderables), title=scroll_info, border_style="dim blue")
+            cache_key = (tuple(rows), selected_row)
+            cached = state.panel_cache.get(proj_name)
+            if cached is not None and cached[0] == cache_key:
+                visible_renderables.append(cached[1])
+            else:
+                dirty.append((len(visible_renderables), proj_name, rows, selected_row, cache_key))
+                visible_renderables.append(None)
+
+        # Build the panels that missed the cache, spread over the pool when there are many
+        if len(dirty) > PARALLEL_BUILD_THRESHOLD:
+            futures = [
+                state.build_pool().submit(_build_project_panel, proj_name, rows, selected_row)
+                for _, proj_name, rows, selected_row, _ in dirty
+            ]
+            panels = [future.result() for future in futures]
+        else:
+            panels = [
+                _build_project_panel(proj_name, rows, selected_row)
+                for _, proj_name, rows, selected_row, _ in dirty
+            ]
+        for (position, proj_name, _, _, cache_key), panel in zip(dirty, panels):
+            state.panel_cache[proj_name] = (cache_key, panel)
+            visible_renderables[position] = panel
+        # Every placeholder has been filled by now; this only narrows the type
+        visible_panels = [panel for panel in visible_renderables if panel is not None]
+
+        # Scroll Indicator
+        if state.debug_mode:
+            scroll_info = _scroll_info(
+                start_idx,
+                end_idx,
+                len(snapshot.project_names),
+                True,
+                selected_index,
+                scroll_offset,
             )
+        else:
+            scroll_info = _scroll_info(start_idx, end_idx, len(snapshot.project_names))
+
+        layout["main"].update(
+            Panel(Group(*visible_panels), title=scroll_info, border_style="dim blue")
+        )
 
     # Footer
-    footer_text = "[b]Q[/b]uit | [b]↑/↓[/b] Navigate | [b]PgUp/PgDn[/b] Scroll Projects"
-    if state.get_selected_container():
-        footer_text += " | [b]L[/b]ogs | [b]R[/b]estart | [b]S[/b]hell | [b]X[/b] Stop"
-    footer_text += " | [b]?[/b] Help"
-    layout["footer"].update(Align.center(footer_text))
+    notification = state.get_notification()
+    if notification:
+        layout["footer"].update(Align.center(notification))
+    else:
+        layout["footer"].update(_FOOTER_WITH_SEL if has_selection else _FOOTER_NO_SEL)
 
     return layout
 
@@ -376,6 +775,14 @@ def main(
     ] = None,
 ):
     """🐳 Interactive Docker Compose stack monitor."""
+    import docker
+    import readchar
+    from docker.errors import DockerException
+    from rich.live import Live
+
+    from .docker_monitor import ContainerMonitor
+    from .keyboard import KeyReader
+
     setup_logging(debug=debug)
 
     try:
@@ -385,16 +792,22 @@ def main(
         console.print(f"[bold red]Error: Failed to connect to Docker.[/bold red]\nDetails: {e}")
         raise typer.Exit(code=1)
 
-    monitor = ContainerMonitor(client)
     app_state = AppState()
+    monitor = ContainerMonitor(client, on_update=app_state.request_render)
+    app_state.stats = monitor.stats
     app_state.debug_mode = debug
     should_quit = threading.Event()
+    key_reader = KeyReader()
 
-    def input_worker(live: Live):
+    def input_worker(live: "Live"):
         """Handle keyboard input in a separate thread."""
         while not should_quit.is_set():
             try:
-                key = readchar.readkey()
+                key = key_reader.read_key()
+                if key is None:
+                    # Closed on shutdown, or stdin hung up and no key can arrive anymore
+                    should_quit.set()
+                    break
                 if key == readchar.key.CTRL_C or key.lower() == "q":
                     should_quit.set()
                 elif key in (readchar.key.UP, "k"):
@@ -406,33 +819,34 @@ def main(
                 elif key == readchar.key.PAGE_DOWN:
                     app_state.scroll_project_view(1)
                 elif key == "?":
-                    live.stop()
-                    console.clear(home=True)
-                    show_help_screen()
-                    live.start(refresh=True)
+                    with key_reader.suspended():
+                        live.stop()
+                        console.clear(home=True)
+                        show_help_screen()
+                        live.start(refresh=True)
                 else:
                     container = app_state.get_selected_container()
-                    if container:
+                    if not container or key.lower() not in CONTAINER_ACTION_KEYS:
+                        continue
+                    # Restart/stop only prompt for y/n, which the key reader answers
+                    # itself; the terminal is handed over only to docker child processes
+                    if key.lower() == "r":
+                        run_container_action(
+                            live, app_state, client, "restart", container, key_reader.read_key
+                        )
+                        continue
+                    if key.lower() == "x":
+                        run_container_action(
+                            live, app_state, client, "stop", container, key_reader.read_key
+                        )
+                        continue
+                    with key_reader.suspended():
                         if key.lower() == "l":
                             cmd = ["docker", "logs", "--tail", "100"]
-                            if "Up" in container["status"]:
+                            if container["is_running"]:
                                 cmd.insert(2, "-f")
                             cmd.append(container["id"])
                             run_docker_command(live, cmd, container["name"])
-                        elif key.lower() == "r":
-                            run_docker_command(
-                                live,
-                                ["docker", "restart", container["id"]],
-                                container["name"],
-                                confirm=True,
-                            )
-                        elif key.lower() == "x":
-                            run_docker_command(
-                                live,
-                                ["docker", "stop", container["id"]],
-                                container["name"],
-                                confirm=True,
-                            )
                         elif key.lower() == "s":
                             run_docker_command(
                                 live,
@@ -444,27 +858,74 @@ def main(
             except Exception as e:
                 logger.error(f"Input handler error: {e}")
                 should_quit.set()
-        app_state.ui_updated_event.set()
+        app_state.request_render()
+
+    def on_resize(signum: int, frame: Optional[FrameType]) -> None:
+        app_state.term_size = console.size
+        app_state.request_render()
+
+    def on_interrupt(signum: int, frame: Optional[FrameType]) -> None:
+        # The terminal sends Ctrl+C to the whole foreground group; while `logs -f`
+        # or a shell is running it is meant for that child, not for DockedUp
+        if not _foreground_child.is_set():
+            signal.default_int_handler(signum, frame)
+
+    previous_sigint = signal.signal(signal.SIGINT, on_interrupt)
+    previous_sigwinch = None
+    if hasattr(signal, "SIGWINCH"):
+        previous_sigwinch = signal.signal(signal.SIGWINCH, on_resize)
 
     try:
         with Live(
             console=console, screen=True, transient=True, redirect_stderr=False, auto_refresh=False
         ) as live:
             monitor.run()
+            key_reader.start()
             input_thread = threading.Thread(target=input_worker, args=(live,), daemon=True)
             input_thread.start()
 
-            # Main render loop
+            # Main render loop. Container state changes arrive through the monitor's
+            # event stream and wake the loop immediately; the refresh rate only paces
+            # redraws for stats/uptime, which are read live and have no event.
+            seen_version = -1
+            seen_requests = app_state.render_requests
+            next_tick = time.monotonic() + refresh_rate
             while not should_quit.is_set():
-                grouped_data = monitor.get_grouped_containers()
-                app_state.update_containers(grouped_data)
-                ui_layout = generate_ui(app_state)
-                live.update(ui_layout, refresh=True)
-                app_state.ui_updated_event.wait(timeout=refresh_rate)
-                app_state.ui_updated_event.clear()
+                if monitor.data_version != seen_version:
+                    seen_version = monitor.data_version
+                    app_state.update_containers(monitor.get_grouped_containers())
+                if previous_sigwinch is None:
+                    # No resize signal on this platform, so poll the size per frame
+                    app_state.term_size = console.size
+                # Skip frames that would come out identical to the one on screen
+                render_key = app_state.render_key(monitor.stats_version)
+                if render_key != app_state.last_render_key:
+                    app_state.last_render_key = render_key
+                    live.update(generate_ui(app_state), refresh=True)
+                last_render = time.monotonic()
+
+                # Periodic frames keep a fixed cadence against a monotonic deadline, so
+                # wake-ups for keys or events in between do not push the next one back
+                if last_render >= next_tick:
+                    next_tick += refresh_rate
+                    if next_tick <= last_render:
+                        # Fell behind (e.g. the help screen was open); restart the cadence
+                        next_tick = last_render + refresh_rate
+                app_state.wait_for_render(seen_requests, timeout=next_tick - last_render)
+
+                # Coalesce bursts (key repeat, event storms) into a single frame
+                elapsed = time.monotonic() - last_render
+                if elapsed < MIN_FRAME_INTERVAL:
+                    time.sleep(MIN_FRAME_INTERVAL - elapsed)
+                seen_requests = app_state.render_requests
     finally:
         should_quit.set()
+        key_reader.close()
+        signal.signal(signal.SIGINT, previous_sigint)
+        if previous_sigwinch is not None:
+            signal.signal(signal.SIGWINCH, previous_sigwinch)
         monitor.stop()
+        app_state.shutdown()
         console.print("\n[bold yellow]👋 See you soon![/bold yellow]")
 
 
@@ -2,25 +2,47 @@
 Docker container monitoring with real-time stats collection.
 """
 
+import itertools
 import threading
 import logging
 from collections import defaultdict
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 
 from docker.client import DockerClient
 from docker.errors import DockerException, NotFound
 
 from .utils import (
+    NO_PROJECT,
+    StatsSample,
     format_status,
     format_ports,
     get_compose_project_name,
-    format_memory_stats,
-    calculate_cpu_percent,
+    iter_json_stream,
     parse_docker_time,
+    stats_sample,
 )
 
 logger = logging.getLogger("dockedup")
 
+# Container events that can change what the monitor shows. Everything else the
+# daemon emits (exec_*, attach, resize, top, ...) is noise; health checks alone
+# produce several exec events per interval for every container.
+STATE_EVENTS = (
+    "create",
+    "start",
+    "restart",
+    "die",
+    "stop",
+    "kill",
+    "pause",
+    "unpause",
+    "health_status",
+    "oom",
+    "rename",
+    "update",
+    "destroy",
+)
+
 
 class ContainerMonitor:
     """
@@ -30,13 +52,37 @@ class ContainerMonitor:
     and resource usage statistics through Docker's event stream and stats API.
     """
 
-    def __init__(self, client: DockerClient):
+    def __init__(self, client: DockerClient, on_update: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            client: Connected Docker client
+            on_update: Optional callback invoked whenever a container is added,
+                changed or removed, so the UI can redraw without polling
+        """
         self.client = client
         self.containers: Dict[str, Dict[str, Any]] = {}
+        # Latest raw stats sample per container id, formatted only when shown.
+        # Each entry is written only by that container's stats thread, as a
+        # single tuple assignment, so readers can look values up without the lock.
+        self.stats: Dict[str, StatsSample] = {}
+        # Advances on every stats sample so readers can tell when to redraw
+        self.stats_version = 0
+        self._stats_counter = itertools.count(1)
+        self.data_version = 0
+        self.on_update = on_update
+        self._grouped_cache: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._grouped_version = -1
         self.lock = threading.Lock()
         self.stop_event = threading.Event()
         self.stats_threads: Dict[str, threading.Thread] = {}
+        # Compose project per container id, read from labels on first inspect
+        self._projects: Dict[str, str] = {}
         self._event_thread: Optional[threading.Thread] = None
+        # Containers with events not yet applied, in arrival order, mapped to
+        # whether one of those events was a destroy
+        self._pending: Dict[str, bool] = {}
+        self._pending_cv = threading.Condition()
+        self._refresh_thread: Optional[threading.Thread] = None
 
     def _stats_worker(self, container_id: str):
         """
@@ -47,31 +93,30 @@ class ContainerMonitor:
         """
         try:
             logger.debug(f"Starting stats collection for container {container_id[:12]}")
-            stats_stream = self.client.api.stats(container=container_id, stream=True, decode=True)
+            stats_stream = self.client.api.stats(container=container_id, stream=True, decode=False)
 
-            for stats in stats_stream:
+            for stats in iter_json_stream(stats_stream):
                 if self.stop_event.is_set():
                     logger.debug(f"Stop event set, ending stats collection for {container_id[:12]}")
                     break
 
-                with self.lock:
-                    if container_id in self.containers:
-                        self.containers[container_id]["cpu"] = calculate_cpu_percent(stats)
-                        self.containers[container_id]["memory"] = format_memory_stats(
-                            stats.get("memory_stats", {})
-                        )
-                    else:
-                        logger.debug(
-                            f"Container {container_id[:12]} removed during stats collection"
-                        )
-                        break
+                if self.stats_threads.get(container_id) is not threading.current_thread():
+                    # The container stopped, restarted or went away; a newer thread
+                    # (if any) owns its stats now
+                    logger.debug(f"Stats thread for {container_id[:12]} reaped")
+                    break
+
+                self.stats[container_id] = stats_sample(stats)
+                self.stats_version = next(self._stats_counter)
 
         except (NotFound, DockerException) as e:
             logger.debug(f"Container {container_id[:12]} stats stream ended: {e}")
-            self._remove_container(container_id)
+            if self.stats_threads.get(container_id) is threading.current_thread():
+                self._remove_container(container_id)
         except Exception as e:
             logger.error(f"Unexpected error in stats worker for {container_id[:12]}: {e}")
-            self._remove_container(container_id)
+            if self.stats_threads.get(container_id) is threading.current_thread():
+                self._remove_container(container_id)
 
     def _event_worker(self):
         """
@@ -82,9 +127,9 @@ class ContainerMonitor:
         """
         try:
             logger.debug("Starting Docker event listener")
-            event_filter = {"type": "container"}
+            event_filter = {"type": "container", "event": list(STATE_EVENTS)}
 
-            for event in self.client.events(decode=True, filters=event_filter):
+            for event in iter_json_stream(self.client.events(filters=event_filter)):
                 if self.stop_event.is_set():
                     logger.debug("Stop event set, ending event listener")
                     break
@@ -110,12 +155,41 @@ class ContainerMonitor:
         if not container_id:
             return
 
+        # "health_status: healthy" and friends carry the result after the action name
+        action = (status or "").split(":", 1)[0]
+        if action not in STATE_EVENTS:
+            return
+
         logger.debug(f"Container event: {status} for {container_id[:12]}")
 
-        if status == "destroy":
-            self._remove_container(container_id)
-        else:
-            self._add_or_update_container(container_id)
+        with self._pending_cv:
+            # Events for a container already waiting to be refreshed fold into that
+            # refresh; a destroy always wins
+            self._pending[container_id] = self._pending.get(container_id, False) or (
+                status == "destroy"
+            )
+            self._pending_cv.notify()
+
+    def _refresh_worker(self) -> None:
+        """
+        Apply queued container events, one inspect per container at a time.
+
+        Runs in its own thread so that the event stream keeps being drained while
+        an inspect is in flight. A burst such as kill/die/stop/start/restart from
+        ``docker restart`` then costs one or two inspects instead of five.
+        """
+        while True:
+            with self._pending_cv:
+                self._pending_cv.wait_for(lambda: self._pending or self.stop_event.is_set())
+                if self.stop_event.is_set():
+                    break
+                container_id = next(iter(self._pending))
+                destroyed = self._pending.pop(container_id)
+
+            if destroyed:
+                self._remove_container(container_id)
+            else:
+                self._add_or_update_container(container_id)
 
     def _add_or_update_container(self, container_id: str):
         """
@@ -131,29 +205,33 @@ class ContainerMonitor:
             config = container_info.get("Config", {})
             network_settings = container_info.get("NetworkSettings", {})
 
-            project_name = get_compose_project_name(config.get("Labels", {}))
-            logger.debug(f"Container {container_id[:12]} assigned to project: {project_name}")
+            # Labels are fixed at creation, so the project is resolved once per container
+            project_name = self._projects.get(container_id)
+            if project_name is None:
+                project_name = get_compose_project_name(config.get("Labels") or {})
+                self._projects[container_id] = project_name
+                logger.debug(f"Container {container_id[:12]} assigned to project: {project_name}")
 
             status_display, health_display = format_status(
                 state.get("Status", "unknown"), health.get("Status")
             )
+            is_running = state.get("Status") == "running"
 
             with self.lock:
-                existing_stats = self.containers.get(container_id, {})
-
                 self.containers[container_id] = {
                     "id": container_info.get("Id"),
                     "name": container_info.get("Name", "").lstrip("/"),
                     "status": status_display,
+                    "is_running": is_running,
                     "health": health_display,
                     "started_at": parse_docker_time(state.get("StartedAt")),
                     "ports": format_ports(network_settings.get("Ports", {})),
                     "project": project_name,
-                    "cpu": existing_stats.get("cpu", "[grey50]—[/grey50]"),
-                    "memory": existing_stats.get("memory", "[grey50]—[/grey50]"),
                 }
+                self.data_version += 1
+
+            self._notify()
 
-            is_running = state.get("Status") == "running"
             has_stats_thread = container_id in self.stats_threads
 
             if is_running and not has_stats_thread:
@@ -169,6 +247,8 @@ class ContainerMonitor:
 
             elif not is_running and has_stats_thread:
                 del self.stats_threads[container_id]
+                # Its last sample would otherwise stay on screen for the stopped container
+                self.stats.pop(container_id, None)
                 logger.debug(f"Removed stats thread for {container_id[:12]}")
 
         except (NotFound, DockerException) as e:
@@ -188,11 +268,25 @@ class ContainerMonitor:
         logger.debug(f"Removing container {container_id[:12]}")
 
         with self.lock:
-            if container_id in self.containers:
-                del self.containers[container_id]
+            removed = self.containers.pop(container_id, None) is not None
+            if removed:
+                self.data_version += 1
 
         if container_id in self.stats_threads:
             del self.stats_threads[container_id]
+        self.stats.pop(container_id, None)
+        self._projects.pop(container_id, None)
+
+        if removed:
+            self._notify()
+
+    def _notify(self) -> None:
+        """Signal the registered listener that the container set has changed."""
+        if self.on_update is not None:
+            try:
+                self.on_update()
+            except Exception as e:
+                logger.debug(f"Update callback failed: {e}")
 
     def initial_populate(self):
         """
@@ -202,11 +296,13 @@ class ContainerMonitor:
         """
         try:
             logger.debug("Performing initial container discovery")
-            containers = self.client.containers.list(all=True)
+            # The low-level listing returns plain dicts; containers.list() would
+            # inspect every container once more just to build its model objects
+            containers = self.client.api.containers(all=True)
             logger.debug(f"Found {len(containers)} containers")
 
             for container in containers:
-                self._add_or_update_container(container.id)
+                self._add_or_update_container(container["Id"])
 
         except DockerException as e:
             logger.error(f"Failed to list containers during initial populate: {e}")
@@ -217,13 +313,18 @@ class ContainerMonitor:
         """
         Start the container monitoring system.
 
-        This method starts the event listener thread and populates the initial
-        container list.
+        This method populates the initial container list and starts the event
+        listener and refresh threads.
         """
         logger.debug("Starting container monitor")
 
         self.initial_populate()
 
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_worker, daemon=True, name="docker-refresh"
+        )
+        self._refresh_thread.start()
+
         self._event_thread = threading.Thread(
             target=self._event_worker, daemon=True, name="docker-events"
         )
@@ -239,6 +340,8 @@ class ContainerMonitor:
         """
         logger.debug("Stopping container monitor")
         self.stop_event.set()
+        with self._pending_cv:
+            self._pending_cv.notify()
 
         try:
             self.client.close()
@@ -249,6 +352,9 @@ class ContainerMonitor:
         if self._event_thread and self._event_thread.is_alive():
             self._event_thread.join(timeout=1.0)
 
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            self._refresh_thread.join(timeout=1.0)
+
         active_threads = list(self.stats_threads.values())
         for thread in active_threads:
             if thread.is_alive():
@@ -262,23 +368,37 @@ class ContainerMonitor:
         """
         Get containers grouped by Docker Compose project.
 
+        The grouping is sorted by project name and, within each project, by
+        container name. It is computed once per data change and the same
+        object is returned until a container is added, changed or removed,
+        so callers can cheaply detect that nothing moved.
+
         Returns:
             Dictionary mapping project names to lists of container dictionaries
         """
         with self.lock:
+            if self._grouped_cache is not None and self._grouped_version == self.data_version:
+                return self._grouped_cache
+            version = self.data_version
             containers_copy = list(self.containers.values())
 
         grouped = defaultdict(list)
 
         for container in containers_copy:
-            project_name = container.get("project", "(No Project)")
+            project_name = container.get("project", NO_PROJECT)
             grouped[project_name].append(container)
             logger.debug(f"Grouped container {container['name']} under project {project_name}")
 
         for project in grouped:
             grouped[project].sort(key=lambda c: c.get("name", ""))
 
-        return dict(sorted(grouped.items()))
+        result = dict(sorted(grouped.items()))
+
+        with self.lock:
+            self._grouped_cache = result
+            self._grouped_version = version
+
+        return result
 
     def get_container_count(self) -> int:
         """
@@ -298,4 +418,4 @@ class ContainerMonitor:
             Number of containers in running state
         """
         with self.lock:
-            return sum(1 for c in self.containers.values() if "✅ Up" in c.get("status", ""))
+            return sum(1 for c in self.containers.values() if c["is_running"])
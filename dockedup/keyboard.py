@@ -0,0 +1,192 @@
+"""
+Keyboard input for the interactive monitor.
+"""
+
+import codecs
+import logging
+import os
+import selectors
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+
+import readchar
+
+if sys.platform != "win32":
+    import termios
+    import tty
+
+logger = logging.getLogger("dockedup")
+
+ESC = "\x1b"
+# How long to wait for the rest of an escape sequence before treating ESC as a key
+ESCAPE_TIMEOUT = 0.05
+
+
+def split_key(buffer: str) -> Optional[Tuple[str, str]]:
+    """
+    Split the first key press off a buffer of terminal input.
+
+    Plain characters are returned as-is. CSI (``ESC [``) and SS3 (``ESC O``)
+    sequences are returned whole, so arrow and page keys come out as the same
+    strings ``readchar.key`` defines.
+
+    Args:
+        buffer: Decoded terminal input, starting at a key boundary
+
+    Returns:
+        Tuple of (key, remaining_buffer), or None if the buffer ends inside an
+        escape sequence and more input is needed
+    """
+    if not buffer:
+        return None
+
+    if buffer[0] != ESC:
+        return buffer[0], buffer[1:]
+
+    if len(buffer) == 1:
+        return None
+
+    introducer = buffer[1]
+    if introducer == "O":
+        # SS3: exactly one final character
+        if len(buffer) < 3:
+            return None
+        return buffer[:3], buffer[3:]
+
+    if introducer != "[":
+        # Alt+<char>
+        return buffer[:2], buffer[2:]
+
+    # CSI: parameter/intermediate bytes up to a final byte in 0x40-0x7E
+    for index in range(2, len(buffer)):
+        if "\x40" <= buffer[index] <= "\x7e":
+            return buffer[: index + 1], buffer[index + 1 :]
+    return None
+
+
+class KeyReader:
+    """
+    Reads key presses from stdin without parking a thread in a blocking read.
+
+    On POSIX terminals stdin is switched to cbreak mode and watched together
+    with a wake-up pipe through a selector, so close() unblocks a pending
+    read_key() immediately. On other platforms, or when stdin is not a
+    terminal, it falls back to ``readchar.readkey()``.
+    """
+
+    def __init__(self) -> None:
+        self._fd: Optional[int] = None
+        self._saved_attrs: Optional[list] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buffer = ""
+        self._closed = False
+        # Set when stdin reached end of input, e.g. the terminal hung up
+        self._at_eof = False
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Put the terminal into cbreak mode and set up the selector."""
+        if sys.platform == "win32" or not sys.stdin.isatty():
+            logger.debug("Terminal input not available, falling back to readchar")
+            return
+
+        self._fd = sys.stdin.fileno()
+        self._saved_attrs = termios.tcgetattr(self._fd)
+        tty.setcbreak(self._fd)
+
+        self._wake_r, self._wake_w = os.pipe()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._fd, selectors.EVENT_READ)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+
+    def close(self) -> None:
+        """Restore the terminal and wake up any pending read_key() call."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._restore_terminal()
+            if self._wake_w is not None:
+                try:
+                    os.write(self._wake_w, b"\0")
+                except OSError as e:
+                    logger.debug(f"Failed to wake key reader: {e}")
+
+    @contextmanager
+    def suspended(self) -> Iterator[None]:
+        """Hand the terminal back in its original mode, e.g. to a child process."""
+        with self._lock:
+            self._restore_terminal()
+        try:
+            yield
+        finally:
+            with self._lock:
+                if sys.platform != "win32" and not self._closed and self._fd is not None:
+                    tty.setcbreak(self._fd)
+            self._buffer = ""
+
+    def read_key(self) -> Optional[str]:
+        """
+        Wait for the next key press.
+
+        Returns:
+            The key as a string, or None once the reader has been closed or
+            stdin has reached end of input
+        """
+        if self._selector is None:
+            return None if self._closed or self._at_eof else readchar.readkey()
+
+        while not self._closed and not self._at_eof:
+            split = split_key(self._buffer)
+            if split is not None:
+                key, self._buffer = split
+                return key
+
+            # A lone ESC is only a key press if nothing follows it promptly
+            timeout = ESCAPE_TIMEOUT if self._buffer else None
+            if not self._fill(timeout) and self._buffer:
+                key, self._buffer = self._buffer, ""
+                return key
+
+        self._release()
+        return None
+
+    def _fill(self, timeout: Optional[float]) -> bool:
+        """Read whatever input is available into the buffer. Returns False on timeout."""
+        assert self._selector is not None and self._fd is not None
+        events = self._selector.select(timeout)
+        if not events:
+            return False
+        for selector_key, _ in events:
+            if selector_key.fd == self._fd:
+                data = os.read(self._fd, 64)
+                if not data:
+                    # End of input stays readable, so selecting again would spin
+                    self._at_eof = True
+                    return True
+                self._buffer += self._decoder.decode(data)
+        return True
+
+    def _restore_terminal(self) -> None:
+        if sys.platform != "win32" and self._saved_attrs is not None and self._fd is not None:
+            try:
+                termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved_attrs)
+            except termios.error as e:
+                # A hung-up terminal has no mode left to restore
+                logger.debug(f"Failed to restore terminal mode: {e}")
+
+    def _release(self) -> None:
+        """Close the selector and wake-up pipe (called by the reading thread)."""
+        with self._lock:
+            if self._selector is not None:
+                self._selector.close()
+                self._selector = None
+            for fd in (self._wake_r, self._wake_w):
+                if fd is not None:
+                    os.close(fd)
+            self._wake_r = self._wake_w = None
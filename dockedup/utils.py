@@ -2,13 +2,70 @@
 Utility functions for Docker container monitoring and formatting.
 """
 
+import functools
+import json
 import logging
+import sys
+import time
 from datetime import datetime, timezone
-from typing import Tuple, Dict, Any, Optional
+from typing import Tuple, Dict, Any, Callable, Iterable, Iterator, NamedTuple, Optional, Union
+
+json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; the stdlib decoder is a few times slower
+    json_loads = json.loads
 
 logger = logging.getLogger("dockedup")
 
+# Fixed markup returned by the formatters, shared instead of repeated as literals
+_DASH = "[grey50]—[/grey50]"
+_ERROR = "[red]Error[/red]"
+_CPU_IDLE = "[green]0.0%[/green]"
+
+# Project name for containers without compose labels
+NO_PROJECT = sys.intern("(No Project)")
+
+# (cpu, memory) shown for containers without a stats sample yet
+NO_STATS = (_DASH, _DASH)
+
+
+# Display strings for the states Docker reports in State.Status
+_STATUS_TABLE = {
+    "running": "[green]✅ Up[/green]",
+    "restarting": "[yellow]🔁 Restarting[/yellow]",
+    "paused": "[blue]⏸️  Paused[/blue]",
+    "exited": "[red]❌ Exited[/red]",
+    "dead": "[red]💀 Dead[/red]",
+    "created": "[grey50]📦 Created[/grey50]",
+    "removing": "[orange1]🗑️  Removing[/orange1]",
+}
+
+_HEALTH_TABLE = {
+    None: _DASH,
+    "": _DASH,
+    "none": _DASH,
+    "healthy": "[green]🟢 Healthy[/green]",
+    "unhealthy": "[red]🔴 Unhealthy[/red]",
+    "starting": "[yellow]🟡 Starting[/yellow]",
+}
+
+
+def _fallback_status(container_status: str) -> str:
+    """Match a status string that is not one of Docker's state names, e.g. "Up 5 minutes"."""
+    status_lower = container_status.lower()
+
+    if "running" in status_lower or "up" in status_lower:
+        return _STATUS_TABLE["running"]
+    for state in ("restarting", "paused", "exited", "dead", "created", "removing"):
+        if state in status_lower:
+            return _STATUS_TABLE[state]
+    return f"[grey50]❓ {container_status.capitalize()}[/grey50]"
+
 
+@functools.lru_cache(maxsize=64)
 def format_status(container_status: str, health_status: Optional[str]) -> Tuple[str, str]:
     """
     Format container status and health status with appropriate colors and icons.
@@ -20,38 +77,12 @@ def format_status(container_status: str, health_status: Optional[str]) -> Tuple[
     Returns:
         Tuple of (formatted_status, formatted_health)
     """
-    # Normalize status to lowercase for comparison
-    status_lower = container_status.lower()
+    status_display = _STATUS_TABLE.get(container_status.lower())
+    if status_display is None:
+        status_display = _fallback_status(container_status)
 
-    if "running" in status_lower or "up" in status_lower:
-        status_display = "[green]✅ Up[/green]"
-    elif "restarting" in status_lower:
-        status_display = "[yellow]🔁 Restarting[/yellow]"
-    elif "paused" in status_lower:
-        status_display = "[blue]⏸️  Paused[/blue]"
-    elif "exited" in status_lower:
-        status_display = "[red]❌ Exited[/red]"
-    elif "dead" in status_lower:
-        status_display = "[red]💀 Dead[/red]"
-    elif "created" in status_lower:
-        status_display = "[grey50]📦 Created[/grey50]"
-    elif "removing" in status_lower:
-        status_display = "[orange1]🗑️  Removing[/orange1]"
-    else:
-        status_display = f"[grey50]❓ {container_status.capitalize()}[/grey50]"
-
-    # Format health status
-    if not health_status:
-        health_display = "[grey50]—[/grey50]"
-    elif health_status == "healthy":
-        health_display = "[green]🟢 Healthy[/green]"
-    elif health_status == "unhealthy":
-        health_display = "[red]🔴 Unhealthy[/red]"
-    elif health_status == "starting":
-        health_display = "[yellow]🟡 Starting[/yellow]"
-    elif health_status == "none":
-        health_display = "[grey50]—[/grey50]"
-    else:
+    health_display = _HEALTH_TABLE.get(health_status)
+    if health_display is None:
         health_display = f"[grey50]❓ {health_status}[/grey50]"
 
     return status_display, health_display
@@ -68,28 +99,61 @@ def format_ports(port_data: Dict[str, Any]) -> str:
         Formatted port string
     """
     if not port_data:
-        return "[grey50]—[/grey50]"
-
-    parts = []
+        return _DASH
+
+    # Fast path for the most common shape: one port published on all interfaces
+    if len(port_data) == 1:
+        ((container_port, host_bindings),) = port_data.items()
+        if isinstance(host_bindings, list) and len(host_bindings) == 1:
+            binding = host_bindings[0]
+            if isinstance(binding, dict) and binding.get("HostIp", "0.0.0.0") in (
+                "0.0.0.0",
+                "::",
+                "",
+            ):
+                return f"[cyan]{binding.get('HostPort', '?')}[/cyan] → {container_port}"
 
     try:
-        for container_port, host_bindings in port_data.items():
-            if host_bindings:
-                for binding in host_bindings:
-                    host_port = binding.get("HostPort", "?")
-                    host_ip = binding.get("HostIp", "0.0.0.0")
-
-                    # Simplify display for common cases
-                    if host_ip in ["0.0.0.0", "::", ""]:
-                        parts.append(f"[cyan]{host_port}[/cyan] → {container_port}")
-                    else:
-                        parts.append(f"[cyan]{host_ip}:{host_port}[/cyan] → {container_port}")
-            else:
-                parts.append(f"[dim]{container_port}[/dim]")
-
+        # Freeze the mapping into a hashable key so repeated inspects of the
+        # same container reuse the formatted string
+        key = tuple(
+            (
+                container_port,
+                (
+                    tuple(
+                        (binding.get("HostIp", "0.0.0.0"), binding.get("HostPort", "?"))
+                        for binding in host_bindings
+                    )
+                    if host_bindings
+                    else None
+                ),
+            )
+            for container_port, host_bindings in port_data.items()
+        )
     except Exception as e:
         logger.debug(f"Error formatting ports: {e}")
-        return "[red]Error[/red]"
+        return _ERROR
+
+    return _format_ports_cached(key)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_ports_cached(
+    port_key: Tuple[Tuple[str, Optional[Tuple[Tuple[str, str], ...]]], ...],
+) -> str:
+    """Format a frozen port mapping, see format_ports."""
+    parts = []
+
+    for container_port, host_bindings in port_key:
+        if host_bindings:
+            for host_ip, host_port in host_bindings:
+                # Simplify display for common cases
+                if host_ip in ["0.0.0.0", "::", ""]:
+                    parts.append(f"[cyan]{host_port}[/cyan] → {container_port}")
+                else:
+                    parts.append(f"[cyan]{host_ip}:{host_port}[/cyan] → {container_port}")
+        else:
+            parts.append(f"[dim]{container_port}[/dim]")
 
     # Limit display to avoid overwhelming the UI
     if len(parts) > 3:
@@ -100,6 +164,14 @@ def format_ports(port_data: Dict[str, Any]) -> str:
     return "\n".join(parts)
 
 
+# Label keys that might contain the project name, in order of preference
+_PROJECT_LABELS = (
+    "com.docker.compose.project",
+    "com.docker.compose.project.working_dir",
+    "org.label-schema.docker.compose.project",
+)
+
+
 def get_compose_project_name(labels: Dict[str, str]) -> str:
     """
     Extract Docker Compose project name from container labels.
@@ -110,22 +182,16 @@ def get_compose_project_name(labels: Dict[str, str]) -> str:
     Returns:
         Project name or default value
     """
-    # Try various label keys that might contain the project name
-    project_keys = [
-        "com.docker.compose.project",
-        "com.docker.compose.project.working_dir",
-        "org.label-schema.docker.compose.project",
-    ]
-
-    for key in project_keys:
+    for key in _PROJECT_LABELS:
         if key in labels:
             project_name = labels[key].strip()
             if project_name:
-                return project_name
+                # Containers of one project then share a single key object
+                return sys.intern(project_name)
 
     # Fallback: try to extract from container name patterns
     # This is a best-effort attempt for containers not managed by compose
-    return "(No Project)"
+    return NO_PROJECT
 
 
 def parse_docker_time(time_str: Optional[str]) -> Optional[datetime]:
@@ -143,6 +209,28 @@ def parse_docker_time(time_str: Optional[str]) -> Optional[datetime]:
     if not time_str or time_str.startswith("0001-01-01"):
         return None
 
+    # Fast path for the fixed shape Docker uses: YYYY-MM-DDTHH:MM:SS[.fraction]Z
+    if (
+        len(time_str) >= 20
+        and time_str[-1] == "Z"
+        and time_str[4] == "-"
+        and time_str[10] == "T"
+        and (len(time_str) == 20 or time_str[19] == ".")
+    ):
+        try:
+            return datetime(
+                int(time_str[0:4]),
+                int(time_str[5:7]),
+                int(time_str[8:10]),
+                int(time_str[11:13]),
+                int(time_str[14:16]),
+                int(time_str[17:19]),
+                int(time_str[20:26].ljust(6, "0")) if len(time_str) > 21 else 0,
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass  # Not what it looked like; let the general parser decide
+
     try:
         # Handle different timestamp formats from Docker
         time_str = time_str.strip()
@@ -151,11 +239,17 @@ def parse_docker_time(time_str: Optional[str]) -> Optional[datetime]:
         if time_str.endswith("Z"):
             time_str = time_str[:-1]
 
-        # Truncate microseconds to 6 digits (Python datetime limitation)
+        # Truncate microseconds to 6 digits (Python datetime limitation),
+        # keeping any UTC offset that follows the fraction
         if "." in time_str:
             main_part, fractional_part = time_str.split(".", 1)
+            offset = ""
+            for index, char in enumerate(fractional_part):
+                if char in "+-":
+                    fractional_part, offset = fractional_part[:index], fractional_part[index:]
+                    break
             fractional_part = fractional_part[:6].ljust(6, "0")
-            time_str = f"{main_part}.{fractional_part}"
+            time_str = f"{main_part}.{fractional_part}{offset}"
 
         # Parse the timestamp
         dt = datetime.fromisoformat(time_str)
@@ -171,31 +265,33 @@ def parse_docker_time(time_str: Optional[str]) -> Optional[datetime]:
         return None
 
 
-def format_uptime(start_time: Optional[datetime]) -> str:
+def format_uptime(start_time: Optional[datetime], now: Optional[float] = None) -> str:
     """
     Format container uptime in human-readable format.
 
     Args:
         start_time: Container start time
+        now: Current time as a Unix timestamp. Pass one value captured per
+            frame when formatting many containers; defaults to ``time.time()``
 
     Returns:
         Formatted uptime string
     """
     if not start_time:
-        return "[grey50]—[/grey50]"
+        return _DASH
 
     try:
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = time.time()
 
-        # Ensure both timestamps have timezone info
+        # Naive timestamps from Docker are UTC
         if start_time.tzinfo is None:
             start_time = start_time.replace(tzinfo=timezone.utc)
 
-        delta = now - start_time
-        total_seconds = int(delta.total_seconds())
+        total_seconds = int(now - start_time.timestamp())
 
         if total_seconds < 0:
-            return "[grey50]—[/grey50]"
+            return _DASH
 
         # Format based on duration
         days, remainder = divmod(total_seconds, 86400)
@@ -213,7 +309,11 @@ def format_uptime(start_time: Optional[datetime]) -> str:
 
     except Exception as e:
         logger.debug(f"Error formatting uptime: {e}")
-        return "[red]Error[/red]"
+        return _ERROR
+
+
+# Unit prefixes by power of 1024
+_BYTE_UNITS = ("", "K", "M", "G", "T", "P")
 
 
 def _format_bytes(size: int) -> str:
@@ -228,19 +328,23 @@ def _format_bytes(size: int) -> str:
     """
     if size < 0:
         return "0B"
+    if size < 1024:
+        return f"{int(size)}B"
 
-    power = 1024
-    n = 0
-    power_labels = {0: "B", 1: "K", 2: "M", 3: "G", 4: "T", 5: "P"}
+    # Each power of 1024 is 10 bits, so the unit falls out of the bit length
+    n = min((int(size).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{size / (1 << (10 * n)):.1f}{_BYTE_UNITS[n]}iB"
 
-    while size >= power and n < len(power_labels) - 1:
-        size /= power
-        n += 1
 
-    if n == 0:
-        return f"{int(size)}B"
-    else:
-        return f"{size:.1f}{power_labels[n]}iB"
+# Markup templates per usage level (low to high), so only the numbers are
+# substituted per call
+_USAGE_COLORS = ("green", "blue", "yellow", "red")
+_MEM_FMT = tuple(f"[{color}]{{}} / {{}} ({{:.1f}}%)[/{color}]" for color in _USAGE_COLORS)
+_CPU_FMT = tuple(f"[{color}]{{:.1f}}%[/{color}]" for color in _USAGE_COLORS)
+
+
+# Memory limits repeat sample after sample, so their strings are worth caching
+_format_limit = functools.lru_cache(maxsize=64)(_format_bytes)
 
 
 def format_memory_stats(mem_stats: Dict[str, Any]) -> str:
@@ -254,33 +358,40 @@ def format_memory_stats(mem_stats: Dict[str, Any]) -> str:
         Formatted memory usage string
     """
     try:
-        usage = mem_stats.get("usage")
-        limit = mem_stats.get("limit")
+        return format_memory_usage(mem_stats.get("usage"), mem_stats.get("limit"))
+    except AttributeError as e:
+        logger.debug(f"Error formatting memory stats: {e}")
+        return _DASH
+
+
+def format_memory_usage(usage: Optional[int], limit: Optional[int]) -> str:
+    """
+    Format a memory usage reading for display.
+
+    Args:
+        usage: Memory in use, in bytes
+        limit: Memory limit, in bytes
 
+    Returns:
+        Formatted memory usage string
+    """
+    try:
         if usage is None or limit is None or limit == 0:
-            return "[grey50]—[/grey50]"
+            return _DASH
 
         # Calculate percentage
         mem_percent = (usage / limit) * 100.0
 
-        # Choose color based on usage
-        if mem_percent > 90.0:
-            color = "red"
-        elif mem_percent > 75.0:
-            color = "yellow"
-        elif mem_percent > 50.0:
-            color = "blue"
-        else:
-            color = "green"
-
-        usage_str = _format_bytes(usage)
-        limit_str = _format_bytes(limit)
+        # Choose color based on usage: each threshold passed moves one step up
+        level = (mem_percent > 50.0) + (mem_percent > 75.0) + (mem_percent > 90.0)
 
-        return f"[{color}]{usage_str} / {limit_str} ({mem_percent:.1f}%)[/{color}]"
+        # Each side keeps its own unit so small usage under a large limit stays
+        # readable; the limit rarely changes, so its string comes from a cache
+        return _MEM_FMT[level].format(_format_bytes(usage), _format_limit(limit), mem_percent)
 
     except (KeyError, TypeError, ZeroDivisionError) as e:
         logger.debug(f"Error formatting memory stats: {e}")
-        return "[grey50]—[/grey50]"
+        return _DASH
 
 
 def calculate_cpu_percent(stats: Dict[str, Any]) -> str:
@@ -293,23 +404,39 @@ def calculate_cpu_percent(stats: Dict[str, Any]) -> str:
     Returns:
         Formatted CPU percentage string
     """
-    try:
-        # Extract CPU stats
-        cpu_stats = stats.get("cpu_stats", {})
-        precpu_stats = stats.get("precpu_stats", {})
+    return format_cpu_percent(cpu_percent(stats))
 
-        cpu_usage = cpu_stats.get("cpu_usage", {})
-        precpu_usage = precpu_stats.get("cpu_usage", {})
 
-        total_usage = cpu_usage.get("total_usage", 0)
-        prev_total_usage = precpu_usage.get("total_usage", 0)
+def cpu_percent(stats: Dict[str, Any]) -> Optional[float]:
+    """
+    Calculate CPU usage percentage from Docker stats, without formatting it.
 
-        system_usage = cpu_stats.get("system_cpu_usage", 0)
-        prev_system_usage = precpu_stats.get("system_cpu_usage", 0)
+    Args:
+        stats: Stats data from Docker stats API
 
-        # Calculate deltas
-        cpu_delta = total_usage - prev_total_usage
-        system_cpu_delta = system_usage - prev_system_usage
+    Returns:
+        CPU percentage (0.0 when there is no usable delta yet), or None if the
+        sample is malformed
+    """
+    try:
+        # Calculate deltas. Complete samples take plain subscripts; the first
+        # sample of a stream usually lacks precpu counters, which count as 0
+        try:
+            cpu_stats = stats["cpu_stats"]
+            precpu_stats = stats["precpu_stats"]
+            cpu_usage = cpu_stats["cpu_usage"]
+            cpu_delta = cpu_usage["total_usage"] - precpu_stats["cpu_usage"]["total_usage"]
+            system_cpu_delta = cpu_stats["system_cpu_usage"] - precpu_stats["system_cpu_usage"]
+        except KeyError:
+            cpu_stats = stats.get("cpu_stats", {})
+            precpu_stats = stats.get("precpu_stats", {})
+            cpu_usage = cpu_stats.get("cpu_usage", {})
+            cpu_delta = cpu_usage.get("total_usage", 0) - precpu_stats.get("cpu_usage", {}).get(
+                "total_usage", 0
+            )
+            system_cpu_delta = cpu_stats.get("system_cpu_usage", 0) - precpu_stats.get(
+                "system_cpu_usage", 0
+            )
 
         # Get number of CPUs
         online_cpus = cpu_stats.get("online_cpus")
@@ -318,30 +445,112 @@ def calculate_cpu_percent(stats: Dict[str, Any]) -> str:
             percpu_usage = cpu_usage.get("percpu_usage", [])
             online_cpus = len(percpu_usage) if percpu_usage else 1
 
-        # Calculate percentage
-        if system_cpu_delta > 0.0 and cpu_delta >= 0.0:
-            percent = (cpu_delta / system_cpu_delta) * online_cpus * 100.0
-
-            # Clamp to reasonable range
-            percent = max(0.0, min(percent, 100.0 * online_cpus))
-
-            # Choose color based on usage
-            if percent > 80.0:
-                color = "red"
-            elif percent > 60.0:
-                color = "yellow"
-            elif percent > 30.0:
-                color = "blue"
-            else:
-                color = "green"
-
-            return f"[{color}]{percent:.1f}%[/{color}]"
-        else:
-            return "[green]0.0%[/green]"
+        return _cpu_percent_core(cpu_delta, system_cpu_delta, online_cpus)
 
-    except (KeyError, TypeError, ZeroDivisionError) as e:
+    except (AttributeError, KeyError, TypeError, ZeroDivisionError) as e:
         logger.debug(f"Error calculating CPU percentage: {e}")
-        return "[grey50]—[/grey50]"
+        return None
+
+
+def _cpu_percent_core(cpu_delta: float, system_cpu_delta: float, online_cpus: int) -> float:
+    """CPU percentage from counter deltas; 0.0 when there is no usable delta."""
+    if system_cpu_delta > 0.0 and cpu_delta >= 0.0:
+        percent = (cpu_delta / system_cpu_delta) * online_cpus * 100.0
+
+        # Clamp to reasonable range
+        return max(0.0, min(percent, 100.0 * online_cpus))
+    return 0.0
+
+
+def format_cpu_percent(percent: Optional[float]) -> str:
+    """
+    Format a CPU percentage for display.
+
+    Args:
+        percent: CPU percentage, or None if unknown
+
+    Returns:
+        Formatted CPU percentage string
+    """
+    if percent is None:
+        return _DASH
+    if percent == 0.0:
+        return _CPU_IDLE
+
+    # Choose color based on usage: each threshold passed moves one step up
+    level = (percent > 30.0) + (percent > 60.0) + (percent > 80.0)
+    return _CPU_FMT[level].format(percent)
+
+
+class StatsSample(NamedTuple):
+    """The numbers the UI shows from one Docker stats document."""
+
+    cpu: Optional[float]
+    mem_usage: Optional[int]
+    mem_limit: Optional[int]
+
+
+def stats_sample(stats: Dict[str, Any]) -> StatsSample:
+    """
+    Reduce a Docker stats document to the numbers the UI shows.
+
+    Args:
+        stats: Stats data from Docker stats API
+
+    Returns:
+        The sample, with fields left None where the document lacks them
+    """
+    mem_stats = stats.get("memory_stats") or {}
+    if not isinstance(mem_stats, dict):
+        return StatsSample(cpu_percent(stats), None, None)
+    return StatsSample(cpu_percent(stats), mem_stats.get("usage"), mem_stats.get("limit"))
+
+
+@functools.lru_cache(maxsize=1024)
+def format_stats_sample(sample: Optional[StatsSample]) -> Tuple[str, str]:
+    """
+    Format a raw stats sample for display.
+
+    Samples are only formatted when a frame shows them, and repeated
+    readings are served from the cache.
+
+    Args:
+        sample: Sample from stats_sample(), or None if none has arrived yet
+
+    Returns:
+        Tuple of (cpu, memory) display strings
+    """
+    if sample is None:
+        return NO_STATS
+    return format_cpu_percent(sample.cpu), format_memory_usage(sample.mem_usage, sample.mem_limit)
+
+
+def iter_json_stream(chunks: Iterable[Union[bytes, str]]) -> Iterator[Any]:
+    """
+    Decode a raw Docker stream of newline-delimited JSON documents.
+
+    Used instead of the SDK's ``decode=True`` so that documents go through
+    ``orjson`` when it is installed. Chunk boundaries need not line up with
+    documents.
+
+    Args:
+        chunks: Raw chunks, e.g. from ``client.api.stats(..., decode=False)``. These
+            are bytes, except for non-chunked responses where the SDK yields text
+
+    Returns:
+        Iterator over the decoded documents
+    """
+    pending = b""
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield json_loads(line)
+    if pending.strip():
+        yield json_loads(pending)
 
 
 def validate_refresh_rate(rate: float) -> bool:
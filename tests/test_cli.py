@@ -0,0 +1,152 @@
+from unittest.mock import MagicMock
+
+from rich.console import ConsoleDimensions
+
+from dockedup.cli import AppState, _fit_projects, run_container_action
+
+# --- HELPERS ---
+
+
+def make_container(container_id, project="my-project"):
+    """A container dictionary shaped like ContainerMonitor's output."""
+    return {
+        "id": container_id,
+        "name": f"{container_id}-name",
+        "status": "[green]✅ Up[/green]",
+        "health": "-",
+        "started_at": None,
+        "is_running": True,
+        "project": project,
+    }
+
+
+# --- TESTS ---
+
+
+def test_container_action_keeps_live_display_stopped_when_reader_closes():
+    """Test a confirmation cut short by shutdown does not take the terminal back."""
+    live = MagicMock()
+    client = MagicMock()
+    state = AppState()
+
+    run_container_action(live, state, client, "restart", make_container("c1"), lambda: None)
+
+    live.stop.assert_called_once()
+    live.start.assert_not_called()
+    client.containers.get.assert_not_called()
+
+
+def test_container_action_restarts_live_display_after_answer(monkeypatch):
+    """Test the live display comes back after the user declines."""
+    monkeypatch.setattr("dockedup.cli.time.sleep", lambda seconds: None)
+    live = MagicMock()
+    client = MagicMock()
+    state = AppState()
+
+    run_container_action(live, state, client, "stop", make_container("c1"), lambda: "n")
+
+    live.start.assert_called_once_with(refresh=True)
+    client.containers.get.assert_not_called()
+
+
+def test_render_key_changes_with_terminal_width():
+    """Test a width-only resize is not mistaken for an unchanged frame."""
+    state = AppState()
+    state.term_size = ConsoleDimensions(80, 24)
+    before = state.render_key(0)
+    state.term_size = ConsoleDimensions(120, 24)
+    assert state.render_key(0) != before
+
+
+def test_move_selection_scrolls_tall_project_into_view():
+    """Test moving into a project taller than the ones above scrolls it fully on screen."""
+    state = AppState()
+    grouped = {name: [make_container(f"{name}1", name)] for name in ("a", "b", "c")}
+    grouped["d"] = [make_container(f"d{i}", "d") for i in range(10)]
+    state.update_containers(grouped)
+    state.viewport_lines = 30
+    state.selected_index = 2
+
+    state.move_selection(1)
+
+    assert state.selected_index == 3
+    end_idx = _fit_projects(state.snapshot, state.scroll_offset, state.viewport_lines)
+    assert state.snapshot.project_names[state.scroll_offset : end_idx] == ("c", "d")
+
+
+def test_update_containers_keeps_indices_when_layout_unchanged():
+    """Test a state-only update reuses the index structures but publishes the new rows."""
+    state = AppState()
+    state.update_containers({"p": [make_container("c1", "p"), make_container("c2", "p")]})
+    first = state.snapshot
+
+    updated = make_container("c2", "p")
+    updated["status"] = "[red]❌ Exited[/red]"
+    state.update_containers({"p": [make_container("c1", "p"), updated]})
+
+    assert state.snapshot is not first
+    assert state.snapshot.project_to_container_indices is first.project_to_container_indices
+    assert state.snapshot.containers[1]["status"] == "[red]❌ Exited[/red]"
+    assert state.snapshot.project_rows["p"][1][2] == "[red]❌ Exited[/red]"
+
+
+def test_update_containers_ignores_same_grouping_object():
+    """Test passing the grouping already shown does not publish a new snapshot."""
+    state = AppState()
+    grouped = {"p": [make_container("c1", "p")]}
+    state.update_containers(grouped)
+    first = state.snapshot
+    state.update_containers(grouped)
+    assert state.snapshot is first
+
+
+def test_update_containers_follows_selected_container():
+    """Test the selection stays on its container when containers before it go away."""
+    state = AppState()
+    state.update_containers(
+        {
+            "a": [make_container("a1", "a")],
+            "b": [make_container("b1", "b"), make_container("b2", "b")],
+        }
+    )
+    state.selected_index = 2
+
+    state.update_containers({"b": [make_container("b1", "b"), make_container("b2", "b")]})
+    assert state.get_selected_container()["id"] == "b2"
+
+    state.update_containers({"b": [make_container("b1", "b")], "c": [make_container("c1", "c")]})
+    assert state.selected_index == 0
+
+
+def test_fit_projects_stops_before_overflow():
+    """Test projects are added while their rows and panel chrome fit the screen."""
+    state = AppState()
+    state.update_containers(
+        {
+            "a": [make_container("a1", "a")],
+            "b": [make_container(f"b{i}", "b") for i in range(3)],
+            "c": [make_container("c1", "c")],
+        }
+    )
+    # a takes 8 lines, b takes 10 and c takes 8
+    assert _fit_projects(state.snapshot, 0, 18) == 2
+    assert _fit_projects(state.snapshot, 0, 25) == 2
+    assert _fit_projects(state.snapshot, 0, 26) == 3
+    assert _fit_projects(state.snapshot, 1, 18) == 3
+
+
+def test_fit_projects_always_shows_start_project():
+    """Test a project taller than the screen is still shown on its own."""
+    state = AppState()
+    state.update_containers({"a": [make_container(f"a{i}", "a") for i in range(20)]})
+    assert _fit_projects(state.snapshot, 0, 8) == 1
+
+
+def test_wait_for_render_sees_request_made_while_rendering():
+    """Test a redraw requested after the loop woke up is not lost."""
+    state = AppState()
+    last_seen = state.render_requests
+    # Requested while the loop is still drawing the previous frame
+    state.request_render()
+    assert state.wait_for_render(last_seen, timeout=0) == last_seen + 1
+    assert state.wait_for_render(last_seen + 1, timeout=0) == last_seen + 1
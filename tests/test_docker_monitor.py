@@ -1,3 +1,4 @@
+import json
 import time
 import threading
 from unittest.mock import MagicMock, patch
@@ -6,6 +7,7 @@ import pytest
 from docker.errors import NotFound
 
 from dockedup.docker_monitor import ContainerMonitor
+from dockedup.utils import StatsSample, format_stats_sample
 
 
 # --- MOCK DATA FIXTURES ---
@@ -44,11 +46,7 @@ def mock_docker_client(mocker, mock_container_data_running, mock_container_data_
     """A comprehensive mock of the Docker client."""
     mock_client = MagicMock()
 
-    mock_container_obj1 = MagicMock()
-    mock_container_obj1.id = "container1_id"
-    mock_container_obj2 = MagicMock()
-    mock_container_obj2.id = "container2_id"
-    mock_client.containers.list.return_value = [mock_container_obj1, mock_container_obj2]
+    mock_client.api.containers.return_value = [{"Id": "container1_id"}, {"Id": "container2_id"}]
 
     # This dictionary will hold the current state for each mock container
     mock_db = {
@@ -73,6 +71,14 @@ def mock_docker_client(mocker, mock_container_data_running, mock_container_data_
     return mock_client
 
 
+def wait_until(predicate, timeout=1.0):
+    """Poll until predicate() is true; returns its final value."""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
 # --- TESTS ---
 
 
@@ -83,16 +89,20 @@ def test_monitor_initial_populate(mock_docker_client):
     assert len(monitor.containers) == 2
     assert "[green]✅ Up[/green]" in monitor.containers["container1_id"]["status"]
     assert "[red]❌ Exited[/red]" in monitor.containers["container2_id"]["status"]
+    assert monitor.containers["container1_id"]["is_running"] is True
+    assert monitor.containers["container2_id"]["is_running"] is False
+    assert monitor.get_running_container_count() == 1
 
 
 def test_monitor_handles_start_event(mock_docker_client):
     """Test if the monitor adds/updates a container on a 'start' event."""
     start_event = {"Type": "container", "status": "start", "id": "container1_id"}
-    mock_docker_client.events.return_value = iter([start_event])
+    mock_docker_client.events.return_value = iter([json.dumps(start_event).encode() + b"\n"])
 
     monitor = ContainerMonitor(mock_docker_client)
     monitor.run()
-    time.sleep(0.1)
+    monitor._event_thread.join(timeout=1.0)
+    wait_until(lambda: not monitor._pending)
     monitor.stop()
 
     assert "container1_id" in monitor.containers
@@ -110,16 +120,36 @@ def test_monitor_handles_stop_event_updates_status(mock_docker_client, mock_cont
     mock_docker_client.mock_db["container1_id"] = stopped_state
 
     stop_event = {"Type": "container", "status": "die", "id": "container1_id"}
-    mock_docker_client.events.return_value = iter([stop_event])
+    mock_docker_client.events.return_value = iter([json.dumps(stop_event).encode() + b"\n"])
 
     monitor.run()
-    time.sleep(0.1)
+    wait_until(lambda: "Exited" in monitor.containers["container1_id"]["status"])
     monitor.stop()
 
     assert "container1_id" in monitor.containers
     assert "[red]❌ Exited[/red]" in monitor.containers["container1_id"]["status"]
 
 
+def test_stopped_container_drops_stats(mock_docker_client, mock_container_data_running):
+    """Test a container that stops loses its stats thread and its last stats sample."""
+    monitor = ContainerMonitor(mock_docker_client)
+    monitor.initial_populate()
+    assert "container1_id" in monitor.stats_threads
+    monitor.stats["container1_id"] = StatsSample(20.0, 1024 * 1024 * 50, 1024 * 1024 * 100)
+
+    stopped_state = mock_container_data_running.copy()
+    stopped_state["State"] = {**stopped_state["State"], "Status": "exited"}
+    mock_docker_client.mock_db["container1_id"] = stopped_state
+    monitor._handle_container_event({"status": "die", "id": "container1_id"})
+
+    monitor.run()
+    wait_until(lambda: not monitor.containers["container1_id"]["is_running"])
+    monitor.stop()
+
+    assert "container1_id" not in monitor.stats_threads
+    assert "container1_id" not in monitor.stats
+
+
 def test_monitor_handles_destroy_event_removes_container(mock_docker_client):
     """Test a 'destroy' event correctly removes the container from the list."""
     monitor = ContainerMonitor(mock_docker_client)
@@ -127,10 +157,10 @@ def test_monitor_handles_destroy_event_removes_container(mock_docker_client):
     assert "container1_id" in monitor.containers
 
     destroy_event = {"Type": "container", "status": "destroy", "id": "container1_id"}
-    mock_docker_client.events.return_value = iter([destroy_event])
+    mock_docker_client.events.return_value = iter([json.dumps(destroy_event).encode() + b"\n"])
 
     monitor.run()
-    time.sleep(0.1)
+    wait_until(lambda: "container1_id" not in monitor.containers)
     monitor.stop()
 
     assert "container1_id" not in monitor.containers
@@ -149,11 +179,84 @@ def test_monitor_stats_worker_updates_container(mock_docker_client):
         "precpu_stats": {"cpu_usage": {"total_usage": 1000}, "system_cpu_usage": 5000},
         "memory_stats": {"usage": 1024 * 1024 * 50, "limit": 1024 * 1024 * 100},
     }
-    mock_docker_client.api.stats.return_value = iter([mock_stats_data])
+    # Raw stream, split mid-document as it may arrive over the wire
+    raw = json.dumps(mock_stats_data).encode() + b"\n"
+    mock_docker_client.api.stats.return_value = iter([raw[:10], raw[10:]])
 
     monitor._add_or_update_container("container1_id")
-    time.sleep(0.1)
+    monitor.stats_threads["container1_id"].join(timeout=1.0)
+
+    assert monitor.stats["container1_id"] == StatsSample(40.0, 1024 * 1024 * 50, 1024 * 1024 * 100)
+    cpu, memory = format_stats_sample(monitor.stats["container1_id"])
+    assert "[blue]40.0%[/blue]" in cpu
+    assert "50.0MiB / 100.0MiB (50.0%)" in memory
+
+
+def test_monitor_notifies_listener_on_changes(mock_docker_client):
+    """Test the update callback fires and the data version advances on container changes."""
+    updates = []
+    monitor = ContainerMonitor(mock_docker_client, on_update=lambda: updates.append(True))
+    monitor.initial_populate()
+    assert len(updates) == 2
+    version = monitor.data_version
+
+    monitor._remove_container("container1_id")
+    assert len(updates) == 3
+    assert monitor.data_version > version
+
+    # Removing an unknown container is not a change
+    monitor._remove_container("container1_id")
+    assert len(updates) == 3
+
+
+def test_grouped_containers_cached_until_change(mock_docker_client):
+    """Test the grouped view is reused until the container set changes."""
+    monitor = ContainerMonitor(mock_docker_client)
+    monitor.initial_populate()
+
+    grouped = monitor.get_grouped_containers()
+    assert list(grouped) == ["my-project"]
+    assert [c["name"] for c in grouped["my-project"]] == ["test-container-1", "test-container-2"]
+    assert monitor.get_grouped_containers() is grouped
+
+    monitor._remove_container("container2_id")
+    regrouped = monitor.get_grouped_containers()
+    assert regrouped is not grouped
+    assert [c["name"] for c in regrouped["my-project"]] == ["test-container-1"]
+
+
+def test_stale_stats_thread_stops_without_side_effects(mock_docker_client):
+    """Test a stats worker that no longer owns its container neither writes stats nor removes it."""
+    monitor = ContainerMonitor(mock_docker_client)
+    monitor.initial_populate()
+    monitor.stats_threads["container1_id"] = threading.Thread(target=lambda: None)
+
+    mock_docker_client.api.stats.return_value = iter([b'{"cpu_stats": {}, "memory_stats": {}}\n'])
+    monitor._stats_worker("container1_id")
+    assert "container1_id" not in monitor.stats
+
+    mock_docker_client.api.stats.side_effect = NotFound("gone")
+    monitor._stats_worker("container1_id")
+    assert "container1_id" in monitor.containers
+
+
+def test_monitor_ignores_non_state_events(mock_docker_client):
+    """Test exec and similar events do not queue a refresh."""
+    monitor = ContainerMonitor(mock_docker_client)
+
+    monitor._handle_container_event({"status": "exec_start: sh", "id": "container1_id"})
+    assert monitor._pending == {}
+
+    monitor._handle_container_event({"status": "health_status: healthy", "id": "container1_id"})
+    assert monitor._pending == {"container1_id": False}
+
+
+def test_monitor_coalesces_pending_events(mock_docker_client):
+    """Test queued events for one container fold into a single refresh."""
+    monitor = ContainerMonitor(mock_docker_client)
+    for status in ("kill", "die", "stop", "start", "restart"):
+        monitor._handle_container_event({"status": status, "id": "container1_id"})
+    monitor._handle_container_event({"status": "die", "id": "container2_id"})
+    monitor._handle_container_event({"status": "destroy", "id": "container2_id"})
 
-    updated_container = monitor.containers["container1_id"]
-    assert "[blue]40.0%[/blue]" in updated_container["cpu"]
-    assert "50.0MiB / 100.0MiB (50.0%)" in updated_container["memory"]
+    assert monitor._pending == {"container1_id": False, "container2_id": True}
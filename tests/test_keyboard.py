@@ -0,0 +1,81 @@
+import os
+import sys
+import threading
+
+import pytest
+import readchar
+
+from dockedup.keyboard import KeyReader, split_key
+
+
+def test_split_key_plain_characters():
+    """Test plain characters are returned one at a time."""
+    assert split_key("jk") == ("j", "k")
+    assert split_key("") is None
+
+
+def test_split_key_escape_sequences_match_readchar():
+    """Test arrow and page keys decode to the same strings readchar uses."""
+    buffer = readchar.key.UP + readchar.key.PAGE_DOWN + "q"
+    key, buffer = split_key(buffer)
+    assert key == readchar.key.UP
+    key, buffer = split_key(buffer)
+    assert key == readchar.key.PAGE_DOWN
+    assert split_key(buffer) == ("q", "")
+
+
+def test_split_key_waits_for_incomplete_sequence():
+    """Test a partial escape sequence is held back until more input arrives."""
+    assert split_key("\x1b") is None
+    assert split_key("\x1b[") is None
+    assert split_key("\x1b[5") is None
+    assert split_key("\x1bO") is None
+
+
+@pytest.fixture
+def pty_reader(monkeypatch):
+    """A started KeyReader on the slave side of a pty; yields (reader, master_fd)."""
+    master_fd, slave_fd = os.openpty()
+    slave = os.fdopen(slave_fd, "r")
+    monkeypatch.setattr(sys, "stdin", slave)
+    reader = KeyReader()
+    reader.start()
+    yield reader, master_fd
+    reader.close()
+    slave.close()
+    try:
+        os.close(master_fd)
+    except OSError:
+        pass
+
+
+def test_read_key_decodes_terminal_input(pty_reader):
+    """Test plain keys and escape sequences are read one key press at a time."""
+    reader, master_fd = pty_reader
+    os.write(master_fd, ("j" + readchar.key.UP).encode())
+    assert reader.read_key() == "j"
+    assert reader.read_key() == readchar.key.UP
+
+
+def test_read_key_returns_lone_escape_after_timeout(pty_reader):
+    """Test ESC with nothing after it is reported as a key press."""
+    reader, master_fd = pty_reader
+    os.write(master_fd, b"\x1b")
+    assert reader.read_key() == "\x1b"
+
+
+def test_close_unblocks_pending_read_key(pty_reader):
+    """Test close() from another thread ends a read_key() that is waiting for input."""
+    reader, _ = pty_reader
+    timer = threading.Timer(0.05, reader.close)
+    timer.start()
+    assert reader.read_key() is None
+    timer.join()
+
+
+def test_read_key_returns_none_on_hangup(pty_reader):
+    """Test end of input ends reading instead of spinning on a readable fd."""
+    reader, master_fd = pty_reader
+    os.close(master_fd)
+    assert reader.read_key() is None
+    assert reader.read_key() is None
@@ -0,0 +1,197 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from dockedup.utils import (
+    _format_bytes,
+    calculate_cpu_percent,
+    cpu_percent,
+    format_ports,
+    format_status,
+    format_uptime,
+    iter_json_stream,
+    parse_docker_time,
+)
+
+# --- TIMESTAMPS ---
+
+
+def test_parse_docker_time_without_fraction():
+    """Test a timestamp with whole seconds only."""
+    assert parse_docker_time("2023-01-01T12:00:00Z") == datetime(
+        2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc
+    )
+
+
+def test_parse_docker_time_truncates_nanoseconds():
+    """Test Docker's 9-digit fractions are cut to microseconds, not rounded."""
+    assert parse_docker_time("2023-01-01T12:00:00.123456789Z") == datetime(
+        2023, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc
+    )
+
+
+def test_parse_docker_time_pads_short_fraction():
+    """Test a short fraction is read as tenths, not microseconds."""
+    assert parse_docker_time("2023-01-01T12:00:00.5Z") == datetime(
+        2023, 1, 1, 12, 0, 0, 500000, tzinfo=timezone.utc
+    )
+
+
+def test_parse_docker_time_with_offset():
+    """Test a timestamp with an explicit UTC offset keeps that offset."""
+    offset = timezone(timedelta(hours=2))
+    assert parse_docker_time("2023-01-01T12:00:00.123+02:00") == datetime(
+        2023, 1, 1, 12, 0, 0, 123000, tzinfo=offset
+    )
+    assert parse_docker_time("2023-01-01T12:00:00+02:00") == datetime(
+        2023, 1, 1, 12, 0, 0, tzinfo=offset
+    )
+    assert parse_docker_time("2023-01-01T12:00:00.123456789+05:30") == datetime(
+        2023, 1, 1, 12, 0, 0, 123456, tzinfo=timezone(timedelta(hours=5, minutes=30))
+    )
+
+
+@pytest.mark.parametrize("time_str", [None, "", "0001-01-01T00:00:00Z", "not a time"])
+def test_parse_docker_time_unset_or_invalid(time_str):
+    """Test Docker's zero time and unparsable strings give None."""
+    assert parse_docker_time(time_str) is None
+
+
+def test_format_uptime_units():
+    """Test each uptime range picks its units."""
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    now = start.timestamp()
+    assert format_uptime(start, now + 59) == "[cyan]59s[/cyan]"
+    assert format_uptime(start, now + 61) == "[yellow]1m 1s[/yellow]"
+    assert format_uptime(start, now + 3600 + 120) == "[green]1h 2m[/green]"
+    assert format_uptime(start, now + 2 * 86400 + 3600) == "[green]2d 1h[/green]"
+    assert format_uptime(start, now - 1) == "[grey50]—[/grey50]"
+    assert format_uptime(None) == "[grey50]—[/grey50]"
+
+
+# --- SIZES ---
+
+
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        (-1, "0B"),
+        (0, "0B"),
+        (1023, "1023B"),
+        (1024, "1.0KiB"),
+        (1048575, "1024.0KiB"),
+        (1048576, "1.0MiB"),
+        (3 * 1024**5, "3.0PiB"),
+        (1024**6, "1024.0PiB"),
+    ],
+)
+def test_format_bytes_unit_boundaries(size, expected):
+    """Test sizes on either side of each unit boundary."""
+    assert _format_bytes(size) == expected
+
+
+# --- CPU ---
+
+
+def test_cpu_percent_complete_sample():
+    """Test a sample with every counter present uses the deltas of both readings."""
+    stats = {
+        "cpu_stats": {
+            "cpu_usage": {"total_usage": 2000},
+            "system_cpu_usage": 10000,
+            "online_cpus": 2,
+        },
+        "precpu_stats": {"cpu_usage": {"total_usage": 1000}, "system_cpu_usage": 5000},
+    }
+    assert cpu_percent(stats) == 40.0
+
+
+def test_cpu_percent_first_sample_without_precpu_counters():
+    """Test a first sample lacking precpu_stats.system_cpu_usage counts it as 0."""
+    stats = {
+        "cpu_stats": {
+            "cpu_usage": {"total_usage": 2000, "percpu_usage": [1000, 1000]},
+            "system_cpu_usage": 10000,
+        },
+        "precpu_stats": {"cpu_usage": {"total_usage": 1000}},
+    }
+    assert cpu_percent(stats) == 20.0
+    assert cpu_percent({"cpu_stats": {}, "precpu_stats": {}}) == 0.0
+
+
+def test_cpu_percent_missing_section():
+    """Test a None cpu_stats section is reported as unknown."""
+    stats = {"cpu_stats": None, "precpu_stats": {}}
+    assert cpu_percent(stats) is None
+    assert calculate_cpu_percent(stats) == "[grey50]—[/grey50]"
+
+
+# --- PORTS ---
+
+
+@pytest.mark.parametrize("host_ip", ["0.0.0.0", "::", ""])
+def test_format_ports_single_binding_on_all_interfaces(host_ip):
+    """Test a port published on all interfaces is shown without the address."""
+    port_data = {"80/tcp": [{"HostIp": host_ip, "HostPort": "8080"}]}
+    assert format_ports(port_data) == "[cyan]8080[/cyan] → 80/tcp"
+
+
+def test_format_ports_single_binding_on_specific_ip():
+    """Test a port published on one address is shown with that address."""
+    port_data = {"80/tcp": [{"HostIp": "127.0.0.1", "HostPort": "8080"}]}
+    assert format_ports(port_data) == "[cyan]127.0.0.1:8080[/cyan] → 80/tcp"
+
+
+def test_format_ports_unpublished_and_overflow():
+    """Test exposed-only ports are dimmed and long lists are cut after three."""
+    assert format_ports({}) == "[grey50]—[/grey50]"
+    assert format_ports({"80/tcp": None}) == "[dim]80/tcp[/dim]"
+    port_data = {f"{port}/tcp": [{"HostIp": "0.0.0.0", "HostPort": str(port)}] for port in range(5)}
+    assert format_ports(port_data).split("\n") == [
+        "[cyan]0[/cyan] → 0/tcp",
+        "[cyan]1[/cyan] → 1/tcp",
+        "[cyan]2[/cyan] → 2/tcp",
+        "[dim]... +2 more[/dim]",
+    ]
+
+
+# --- STATUS ---
+
+
+def test_format_status_known_states():
+    """Test Docker's state names and health values map to their display strings."""
+    assert format_status("running", "healthy") == (
+        "[green]✅ Up[/green]",
+        "[green]🟢 Healthy[/green]",
+    )
+    assert format_status("exited", None) == ("[red]❌ Exited[/red]", "[grey50]—[/grey50]")
+    assert format_status("RUNNING", "none") == ("[green]✅ Up[/green]", "[grey50]—[/grey50]")
+
+
+def test_format_status_free_form_status():
+    """Test status strings that are not state names fall back to keyword matching."""
+    assert format_status("Up 5 minutes", "")[0] == "[green]✅ Up[/green]"
+    assert format_status("Exited (0) 2 hours ago", None)[0] == "[red]❌ Exited[/red]"
+
+
+def test_format_status_unknown_values():
+    """Test unknown status and health values are shown as-is with a question mark."""
+    assert format_status("frozen", "bogus") == (
+        "[grey50]❓ Frozen[/grey50]",
+        "[grey50]❓ bogus[/grey50]",
+    )
+
+
+# --- STREAM DECODING ---
+
+
+def test_iter_json_stream_joins_documents_across_chunks():
+    """Test documents split over chunk boundaries are decoded whole."""
+    chunks = [b'{"a": 1}\n{"b"', b": 2}\n", b'{"c": 3}']
+    assert list(iter_json_stream(chunks)) == [{"a": 1}, {"b": 2}, {"c": 3}]
+
+
+def test_iter_json_stream_accepts_text_chunks():
+    """Test text chunks, as the SDK yields for non-chunked responses, are decoded."""
+    chunks = ['{"a": 1}\n', b'{"b": 2}\n']
+    assert list(iter_json_stream(chunks)) == [{"a": 1}, {"b": 2}]